@@ -0,0 +1,80 @@
+# encoding: utf-8
+"""
+Latency of the children lookup of get_block_from_db: the former overlap filter over
+blocks.parents against the block_parents edge table. Runs against the database in
+SQL_URI and is meant for a full mainnet database (10M+ blocks) with
+scripts/mappings/block_parents.sql applied.
+
+    pipenv run python -m benchmarks.block_children [sample size]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import func, text
+from sqlalchemy.future import select
+
+from dbsession import async_session
+from models.Block import Block
+from models.BlockParent import BlockParent
+
+SAMPLE_SIZE = 200
+
+
+async def time_query(s, query):
+    start = time.perf_counter()
+    (await s.execute(query)).all()
+    return time.perf_counter() - start
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:>14}: p50 {statistics.median(latencies) * 1000:8.2f} ms"
+        f"   p99 {p99 * 1000:8.2f} ms"
+    )
+
+
+async def main(sample_size):
+    async with async_session() as s:
+        block_count = (
+            await s.execute(select(func.count()).select_from(Block))
+        ).scalar()
+        block_hashes = (
+            (
+                await s.execute(
+                    text("SELECT hash FROM blocks TABLESAMPLE SYSTEM (1) LIMIT :limit"),
+                    {"limit": sample_size},
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        print(f"{block_count} blocks, {len(block_hashes)} sampled")
+        overlap, edge_table = [], []
+
+        for block_hash in block_hashes:
+            overlap.append(
+                await time_query(
+                    s, select(Block).filter(Block.parents.op("&&")([block_hash]))
+                )
+            )
+            edge_table.append(
+                await time_query(
+                    s,
+                    select(BlockParent.child_hash).filter(
+                        BlockParent.parent_hash == block_hash
+                    ),
+                )
+            )
+
+    report("parents &&", overlap)
+    report("block_parents", edge_table)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else SAMPLE_SIZE))
@@ -0,0 +1,135 @@
+# encoding: utf-8
+"""
+Compares assembling a block's transactions by scanning all inputs / outputs per
+transaction (the former get_block_transactions) with grouping them once and
+resolving previous outpoints from a (hash, index) map.
+
+    pipenv run python -m benchmarks.block_transactions
+"""
+
+import random
+
+from benchmarks.harness import compare
+from endpoints.utils import group_by_transaction_id
+
+TX_COUNT = 250
+IO_COUNT = 5_000  # inputs and outputs each
+ROUNDS = 20
+
+
+def random_hash():
+    return f"{random.getrandbits(256):064x}"
+
+
+def synthetic_block(tx_count=TX_COUNT, io_count=IO_COUNT):
+    transactions = [dict(transaction_id=random_hash()) for _ in range(tx_count)]
+    tx_ids = [tx["transaction_id"] for tx in transactions]
+
+    tx_outputs = [
+        dict(
+            transaction_id=random.choice(tx_ids),
+            index=i,
+            amount=i,
+            script_public_key_address=f"kaspa:{i}",
+        )
+        for i in range(io_count)
+    ]
+    previous_outputs = [
+        dict(
+            transaction_id=random_hash(),
+            index=random.randrange(4),
+            amount=i,
+            script_public_key_address=f"kaspa:{i}",
+        )
+        for i in range(io_count)
+    ]
+    tx_inputs = [
+        dict(
+            transaction_id=random.choice(tx_ids),
+            index=i,
+            previous_outpoint_hash=prev["transaction_id"],
+            previous_outpoint_index=prev["index"],
+        )
+        for i, prev in enumerate(previous_outputs)
+    ]
+
+    return transactions, tx_inputs, tx_outputs, previous_outputs
+
+
+def input_dict(tx_inp, previous_output):
+    return {
+        "index": tx_inp["index"],
+        "amount": previous_output["amount"],
+        "script_public_key_address": previous_output["script_public_key_address"],
+    }
+
+
+def scan_per_transaction(transactions, tx_inputs, tx_outputs, previous_outputs):
+    previous_outpoint_txn_map = {}
+    for tx in previous_outputs:
+        if tx["transaction_id"] not in previous_outpoint_txn_map:
+            previous_outpoint_txn_map[tx["transaction_id"]] = {}
+        previous_outpoint_txn_map[tx["transaction_id"]][tx["index"]] = tx
+
+    return [
+        (
+            [
+                input_dict(
+                    tx_inp,
+                    previous_outpoint_txn_map[tx_inp["previous_outpoint_hash"]][
+                        tx_inp["previous_outpoint_index"]
+                    ],
+                )
+                for tx_inp in tx_inputs
+                if tx_inp["transaction_id"] == tx["transaction_id"]
+                and previous_outpoint_txn_map.get(
+                    tx_inp["previous_outpoint_hash"], {}
+                ).get(tx_inp["previous_outpoint_index"])
+            ],
+            [
+                x["index"]
+                for x in tx_outputs
+                if x["transaction_id"] == tx["transaction_id"]
+            ],
+        )
+        for tx in transactions
+    ]
+
+
+def group_once(transactions, tx_inputs, tx_outputs, previous_outputs):
+    previous_outputs = {(x["transaction_id"], x["index"]): x for x in previous_outputs}
+    outputs_by_tx = group_by_transaction_id(tx_outputs)
+    inputs_by_tx = group_by_transaction_id(tx_inputs)
+
+    return [
+        (
+            [
+                input_dict(tx_inp, previous_output)
+                for tx_inp in inputs_by_tx.get(tx["transaction_id"], [])
+                if (
+                    previous_output := previous_outputs.get(
+                        (
+                            tx_inp["previous_outpoint_hash"],
+                            tx_inp["previous_outpoint_index"],
+                        )
+                    )
+                )
+            ],
+            [x["index"] for x in outputs_by_tx.get(tx["transaction_id"], [])],
+        )
+        for tx in transactions
+    ]
+
+
+def main():
+    compare(
+        f"{TX_COUNT} transactions, {IO_COUNT} inputs + {IO_COUNT} outputs",
+        scan_per_transaction,
+        group_once,
+        synthetic_block(),
+        ROUNDS,
+    )
+
+
+if __name__ == "__main__":
+    main()
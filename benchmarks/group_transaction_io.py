@@ -0,0 +1,60 @@
+# encoding: utf-8
+"""
+Compares building a page's per-transaction inputs / outputs by scanning all rows for
+every transaction with grouping them by transaction_id once.
+
+    pipenv run python -m benchmarks.group_transaction_io
+"""
+
+import random
+
+from benchmarks.harness import compare
+from endpoints.utils import group_by_transaction_id
+
+TX_COUNT = 100
+IO_COUNT = 10_000  # inputs and outputs each
+ROUNDS = 20
+
+
+def synthetic_page(tx_count=TX_COUNT, io_count=IO_COUNT):
+    tx_ids = [f"{random.getrandbits(256):064x}" for _ in range(tx_count)]
+
+    def rows():
+        return [
+            dict(transaction_id=random.choice(tx_ids), index=i) for i in range(io_count)
+        ]
+
+    return tx_ids, rows(), rows()
+
+
+def scan_per_transaction(tx_ids, tx_inputs, tx_outputs):
+    return [
+        (
+            [x for x in tx_outputs if x["transaction_id"] == tx_id],
+            [x for x in tx_inputs if x["transaction_id"] == tx_id],
+        )
+        for tx_id in tx_ids
+    ]
+
+
+def group_once(tx_ids, tx_inputs, tx_outputs):
+    outputs_by_tx = group_by_transaction_id(tx_outputs)
+    inputs_by_tx = group_by_transaction_id(tx_inputs)
+
+    return [
+        (outputs_by_tx.get(tx_id, []), inputs_by_tx.get(tx_id, [])) for tx_id in tx_ids
+    ]
+
+
+def main():
+    compare(
+        f"{TX_COUNT} transactions, {IO_COUNT} inputs + {IO_COUNT} outputs",
+        scan_per_transaction,
+        group_once,
+        synthetic_page(),
+        ROUNDS,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# encoding: utf-8
+"""
+Shared harness of the in-memory benchmarks: the former implementation against its
+replacement on the same synthetic data.
+"""
+
+import timeit
+
+
+def compare(description, baseline, optimized, data, rounds=20):
+    """
+    Checks both functions return the same for data, then prints the best time of
+    each over rounds and the speedup
+    """
+    assert baseline(*data) == optimized(*data)
+
+    print(description)
+    results = {}
+
+    for f in (baseline, optimized):
+        results[f] = min(timeit.repeat(lambda: f(*data), number=1, repeat=rounds))
+        print(f"{f.__name__:>22}: {results[f] * 1000:8.2f} ms")
+
+    print(f"{'speedup':>22}: {results[baseline] / results[optimized]:8.1f}x")
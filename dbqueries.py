@@ -0,0 +1,247 @@
+# encoding: utf-8
+"""
+Hot read queries straight on the asyncpg pool, without the ORM. They return
+asyncpg Records. asyncpg prepares every statement once per connection and reuses
+it, and arrays are passed as one parameter (= ANY / UNNEST), so each query keeps a
+single prepared statement regardless of how many ids it gets.
+"""
+
+import asyncpg
+
+from dbsession import get_pg_pool
+
+TRANSACTION_COLUMNS = """
+    t.subnetwork_id,
+    t.transaction_id,
+    t.hash,
+    t.mass,
+    t.block_hash,
+    t.block_time,
+    t.is_accepted,
+    t.accepting_block_hash
+"""
+
+OUTPUT_COLUMNS = """
+    transaction_id,
+    index,
+    amount,
+    script_public_key,
+    script_public_key_address,
+    script_public_key_type,
+    accepting_block_hash
+"""
+
+INPUT_COLUMNS = """
+    transaction_id,
+    index,
+    previous_outpoint_hash,
+    previous_outpoint_index,
+    signature_script
+"""
+
+OFFSET_PAGE_TIMEOUT = 10  # seconds, deep offsets are slow
+
+
+async def fetch_transactions(transaction_ids: list[str]):
+    """
+    Transactions with the blue score of their accepting block, newest first
+    """
+    pool = await get_pg_pool()
+    return await pool.fetch(
+        f"""
+        SELECT {TRANSACTION_COLUMNS}, b.blue_score AS accepting_block_blue_score
+        FROM transactions t
+        LEFT JOIN blocks b ON t.accepting_block_hash = b.hash
+        WHERE t.transaction_id = ANY($1::VARCHAR[])
+        ORDER BY t.block_time DESC
+        """,
+        transaction_ids,
+    )
+
+
+async def fetch_block_transactions(block_hash: str):
+    pool = await get_pg_pool()
+    backfilling = "EXISTS (SELECT FROM block_transactions_backfill)"
+
+    try:
+        transactions = await pool.fetch(
+            f"""
+            SELECT {TRANSACTION_COLUMNS}
+            FROM block_transactions bt
+            JOIN transactions t ON t.transaction_id = bt.transaction_id
+            WHERE bt.block_hash = $1
+            """,
+            block_hash,
+        )
+    except asyncpg.UndefinedTableError:
+        # scripts/mappings/block_transactions.sql not applied yet, always scan
+        transactions, backfilling = [], "TRUE"
+
+    if not transactions:
+        # unknown or not stored yet, unless the block_transactions backfill is still
+        # running (see scripts/mappings/block_transactions.sql). The scan only runs
+        # then, afterwards the EXISTS filter ends the query right away.
+        transactions = await pool.fetch(
+            f"""
+            SELECT {TRANSACTION_COLUMNS}
+            FROM transactions t
+            WHERE {backfilling}
+                AND t.block_hash @> ARRAY[$1]::VARCHAR[]
+            """,
+            block_hash,
+        )
+
+    return transactions
+
+
+async def fetch_outputs(transaction_ids: list[str]):
+    if not transaction_ids:
+        return []
+
+    pool = await get_pg_pool()
+    return await pool.fetch(
+        f"""
+        SELECT {OUTPUT_COLUMNS}
+        FROM transactions_outputs
+        WHERE transaction_id = ANY($1::VARCHAR[])
+        """,
+        transaction_ids,
+    )
+
+
+async def fetch_inputs(transaction_ids: list[str]):
+    if not transaction_ids:
+        return []
+
+    pool = await get_pg_pool()
+    return await pool.fetch(
+        f"""
+        SELECT {INPUT_COLUMNS}
+        FROM transactions_inputs
+        WHERE transaction_id = ANY($1::VARCHAR[])
+        """,
+        transaction_ids,
+    )
+
+
+async def fetch_previous_outputs(tx_inputs):
+    """
+    Resolves the outputs spent by the given inputs.
+    Returns {(hash, index): Record(amount, script_public_key_address)}
+    """
+    outpoints = {
+        (x["previous_outpoint_hash"], x["previous_outpoint_index"]) for x in tx_inputs
+    }
+
+    if not outpoints:
+        return {}
+
+    hashes, indexes = zip(*outpoints)
+    pool = await get_pg_pool()
+    rows = await pool.fetch(
+        """
+        SELECT
+            o.transaction_id,
+            o.index,
+            o.amount,
+            o.script_public_key_address
+        FROM transactions_outputs o
+        JOIN UNNEST($1::VARCHAR[], $2::INTEGER[]) AS p(hash, index)
+            ON o.transaction_id = p.hash
+            AND o.index = p.index
+        """,
+        hashes,
+        indexes,
+    )
+
+    return {(row["transaction_id"], row["index"]): row for row in rows}
+
+
+async def fetch_spent_tx_hashes(outpoints: list[tuple[str, int]]):
+    """
+    Maps the given (hash, index) outpoints to the transaction spending them, backed
+    by the index in scripts/indexes/transactions_inputs.sql
+    """
+    if not outpoints:
+        return {}
+
+    hashes, indexes = zip(*outpoints)
+    pool = await get_pg_pool()
+    rows = await pool.fetch(
+        """
+        SELECT
+            i.previous_outpoint_hash,
+            i.previous_outpoint_index,
+            i.transaction_id
+        FROM transactions_inputs i
+        JOIN UNNEST($1::VARCHAR[], $2::INTEGER[]) AS o(hash, index)
+            ON i.previous_outpoint_hash = o.hash
+            AND i.previous_outpoint_index = o.index
+        """,
+        hashes,
+        indexes,
+    )
+
+    return {
+        (row["previous_outpoint_hash"], row["previous_outpoint_index"]): row[
+            "transaction_id"
+        ]
+        for row in rows
+    }
+
+
+async def fetch_address_transaction_page(
+    address: str,
+    limit: int,
+    offset: int = 0,
+    before: tuple[int, int] | None = None,
+    after: tuple[int, int] | None = None,
+):
+    """
+    A page of (transaction_id, block_time, id) of tx_id_address_mapping for an
+    address, newest first. before / after are (block_time, id) keys.
+    """
+    pool = await get_pg_pool()
+
+    if before:
+        return await pool.fetch(
+            """
+            SELECT transaction_id, block_time, id
+            FROM tx_id_address_mapping
+            WHERE address = $1 AND (block_time, id) < ($2, $3)
+            ORDER BY block_time DESC, id DESC
+            LIMIT $4
+            """,
+            address,
+            *before,
+            limit,
+        )
+
+    if after:
+        rows = await pool.fetch(
+            """
+            SELECT transaction_id, block_time, id
+            FROM tx_id_address_mapping
+            WHERE address = $1 AND (block_time, id) > ($2, $3)
+            ORDER BY block_time ASC, id ASC
+            LIMIT $4
+            """,
+            address,
+            *after,
+            limit,
+        )
+        return rows[::-1]
+
+    return await pool.fetch(
+        """
+        SELECT transaction_id, block_time, id
+        FROM tx_id_address_mapping
+        WHERE address = $1
+        ORDER BY block_time DESC, id DESC
+        LIMIT $2 OFFSET $3
+        """,
+        address,
+        limit,
+        offset,
+        timeout=OFFSET_PAGE_TIMEOUT,
+    )
@@ -1,5 +1,8 @@
+import asyncio
 import logging
 import os
+
+import asyncpg
 from dotenv import load_dotenv
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +19,46 @@ Base = declarative_base()
 session_maker = sessionmaker(engine)
 async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+# plain asyncpg pool for the hot read queries in dbqueries.py
+pg_pool = None  # type: asyncpg.Pool
+_pg_pool_lock = asyncio.Lock()
+
+
+async def get_pg_pool():
+    global pg_pool
+
+    if pg_pool is None:
+        async with _pg_pool_lock:
+            if pg_pool is None:
+                pg_pool = await asyncpg.create_pool(
+                    engine.url.set(drivername="postgresql").render_as_string(
+                        hide_password=False
+                    ),
+                    min_size=1,
+                    max_size=int(os.getenv("SQL_POOL_SIZE", 10)),
+                )
+
+    return pg_pool
+
+
+async def close_pg_pool():
+    global pg_pool
+
+    if pg_pool is not None:
+        await pg_pool.close()
+        pg_pool = None
+
+
+def is_undefined_table(e: Exception) -> bool:
+    """
+    Whether e (asyncpg or SQLAlchemy) comes from a query on a table that does not
+    exist yet, i.e. its script under scripts/ has not been applied
+    """
+    return (
+        getattr(getattr(e, "orig", e), "sqlstate", None)
+        == asyncpg.UndefinedTableError.sqlstate
+    )
+
 
 def create_all(drop=False):
     if drop:
@@ -1,10 +1,14 @@
 # encoding: utf-8
+import asyncio
+import logging
+from collections import OrderedDict
 from typing import Any, List
 import requests
 
 from fastapi import Path, HTTPException, Query
 
-from dbsession import async_session
+import dbqueries
+from dbsession import async_session, is_undefined_table
 from endpoints.models import (
     AddressInfoResponse,
     TransactionsResponse,
@@ -14,55 +18,71 @@ from endpoints.models import (
 from endpoints.stats import get_virtual_selected_parent_blue_score
 from models.AddressBalancesRecord import AddressBalancesRecord
 from models.AddressTag import AddressTag
+from models.AddressTxCount import AddressTxCount
 from models.TxAddrMapping import TxAddrMapping
 from server import app, kaspad_client
 
-from pydantic import parse_obj_as
 from sqlalchemy.future import select
 from sqlalchemy import func
 from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
 
 from dbsession import async_session
 from endpoints import filter_fields
-from models.Block import Block
-from models.Transaction import Transaction, TransactionOutput, TransactionInput
+from endpoints.utils import decode_cursor, encode_cursor, group_by_transaction_id
 from sqlalchemy import func
-from cache import AsyncTTL
+from helper import notifications
+from helper.caches import AsyncTTL
+
+_logger = logging.getLogger(__name__)
 
 MAX_VISIBLE_RANK = 1000
+ADDRESS_CACHE_SIZE = 10000  # entries of the per-address caches
+NOTIFIED_TX_SIZE = 100000  # notified transactions remembered until accepted
+NOTIFIED_OUTPUT_SIZE = 200000
 
+# transaction id -> addresses whose balance it changes, for the transactions of
+# notified blocks. Balances change once a chain block accepts the transaction.
+NOTIFIED_TX_ADDRESSES = OrderedDict()
+# (transaction id, index) -> address, outputs of notified blocks. Resolves inputs
+# spending outputs the indexer has not stored yet.
+NOTIFIED_OUTPUT_ADDRESSES = OrderedDict()
 
-@AsyncTTL(time_to_live=60 * 60)
-async def get_address_rank(address: str):
-    sql = f"""
-                WITH RankedAddresses AS (
-                    SELECT  
-                        address,
-                        balance,
-                        RANK() OVER (ORDER BY balance DESC) as rank
-                    FROM address_balances
-                    LIMIT :max_visible_rank
-                )
 
-                SELECT 
-                    rank
-                FROM RankedAddresses
-                WHERE address = :address;
+@AsyncTTL(time_to_live=5 * 60, maxsize=1, shared=True)
+async def get_address_ranks():
+    """
+    Snapshot of address -> rank for the top MAX_VISIBLE_RANK holders, read from
+    agg_top_holders (refreshed hourly). Equal balances share a rank, like RANK().
+    """
+    sql = f"""
+                SELECT
+                    address,
+                    balance
+                FROM agg_top_holders
+                ORDER BY balance DESC
+                LIMIT :max_visible_rank
             """
 
     async with async_session() as session:
-        resp = await session.execute(
-            text(sql), {"address": address, "max_visible_rank": MAX_VISIBLE_RANK}
-        )
+        resp = await session.execute(text(sql), {"max_visible_rank": MAX_VISIBLE_RANK})
         resp = resp.all()
 
-    if len(resp) == 0:
-        return None
+    ranks = {}
+    rank, previous_balance = 0, None
+    for position, (address, balance) in enumerate(resp, start=1):
+        if balance != previous_balance:
+            rank, previous_balance = position, balance
+        ranks[address] = rank
 
-    return resp[0][0]
+    return ranks
 
 
-@AsyncTTL(time_to_live=10 * 60)
+async def get_address_rank(address: str):
+    return (await get_address_ranks()).get(address)
+
+
+@AsyncTTL(time_to_live=10 * 60, maxsize=ADDRESS_CACHE_SIZE)
 async def get_addresses_tags(addresses: List[str]):
     async with async_session() as s:
         tags = await s.execute(
@@ -74,7 +94,7 @@ async def get_addresses_tags(addresses: List[str]):
     return [{"address": tag[0], "name": tag[1], "link": tag[2]} for tag in tags.all()]
 
 
-@AsyncTTL(time_to_live=30 * 60)
+@AsyncTTL(time_to_live=30 * 60, maxsize=ADDRESS_CACHE_SIZE)
 async def get_addresses_balance_records(addresses: List[str], limit: int = 1):
     subquery = (
         select(
@@ -106,7 +126,7 @@ async def get_addresses_balance_records(addresses: List[str], limit: int = 1):
     ]
 
 
-@AsyncTTL(time_to_live=10 * 60)
+@AsyncTTL(time_to_live=10 * 60, maxsize=ADDRESS_CACHE_SIZE)
 async def get_address_tags(address: str):
     async with async_session() as s:
         tags = await s.execute(
@@ -124,36 +144,138 @@ async def get_address_tags(address: str):
     return tags
 
 
-@AsyncTTL(time_to_live=3)
+# evicted by on_block_added and on_virtual_chain_changed when a transaction touches
+# the address, the TTL covers spent outputs which could not be resolved
+@AsyncTTL(time_to_live=60, maxsize=ADDRESS_CACHE_SIZE)
 async def get_address_balance(address: str):
     """
     Get balance for a given kaspa address
     """
     resp = await kaspad_client.request(
-        "getBalanceByAddressRequest", params={"address": address}
+        "getBalanceByAddressRequest",
+        params={"address": address},
+        hedge=True,
+        raw=True,
     )
 
-    try:
-        resp = resp["getBalanceByAddressResponse"]
-    except KeyError:
-        if (
-            "getUtxosByAddressesResponse" in resp
-            and "error" in resp["getUtxosByAddressesResponse"]
-        ):
+    if resp.WhichOneof("payload") != "getBalanceByAddressResponse":
+        if resp.getUtxosByAddressesResponse.HasField("error"):
             raise HTTPException(
-                status_code=400, detail=resp["getUtxosByAddressesResponse"]["error"]
+                status_code=400,
+                detail=resp.getUtxosByAddressesResponse.error.message,
             )
         else:
-            raise
+            raise KeyError("getBalanceByAddressResponse")
+
+    if resp.getBalanceByAddressResponse.HasField("error"):
+        raise HTTPException(
+            status_code=400,
+            detail=resp.getBalanceByAddressResponse.error.message,
+        )
+
+    # 0 if address is ok, but no utxos there
+    return resp.getBalanceByAddressResponse.balance
+
+
+def _remember(items: OrderedDict, key, value, maxsize: int):
+    items[key] = value
+    items.move_to_end(key)
+
+    while len(items) > maxsize:
+        items.popitem(last=False)
+
+
+async def _evict_balances(addresses):
+    for address in addresses:
+        await get_address_balance.invalidate(address)
+
+
+async def on_block_added(block):
+    """
+    Evicts the balances of the addresses touched by the transactions of a new block,
+    the ones of its outputs and of the outputs its inputs spend, and remembers them
+    for on_virtual_chain_changed.
+    """
+    tx_addresses = {}
+    spent_outpoints = {}  # transaction id -> [(hash, index)]
+
+    for tx in block.get("transactions", []):
+        tx_id = tx.get("verboseData", {}).get("transactionId")
+
+        if tx_id is None:
+            continue
+
+        # registered before resolving the inputs, the accepting chain block may
+        # come in meanwhile. The input addresses are evicted below in any case.
+        tx_addresses[tx_id] = set()
+        _remember(NOTIFIED_TX_ADDRESSES, tx_id, tx_addresses[tx_id], NOTIFIED_TX_SIZE)
+
+        for index, output in enumerate(tx.get("outputs", [])):
+            address = output.get("verboseData", {}).get("scriptPublicKeyAddress")
+
+            if address:
+                tx_addresses[tx_id].add(address)
+                _remember(
+                    NOTIFIED_OUTPUT_ADDRESSES,
+                    (tx_id, index),
+                    address,
+                    NOTIFIED_OUTPUT_SIZE,
+                )
+
+        # index 0 is left out by MessageToDict
+        spent_outpoints[tx_id] = [
+            (
+                x["previousOutpoint"]["transactionId"],
+                x["previousOutpoint"].get("index", 0),
+            )
+            for x in tx.get("inputs", [])
+        ]
+
+    unresolved = [
+        outpoint
+        for outpoints in spent_outpoints.values()
+        for outpoint in outpoints
+        if outpoint not in NOTIFIED_OUTPUT_ADDRESSES
+    ]
 
     try:
-        balance = int(resp["balance"])
+        previous_outputs = await dbqueries.fetch_previous_outputs(
+            [
+                {"previous_outpoint_hash": h, "previous_outpoint_index": i}
+                for h, i in unresolved
+            ]
+        )
+    except Exception as e:
+        # spent outputs of other addresses stay cached until their TTL is over
+        _logger.warning(f"Resolving spent outputs of a new block failed: {e!r}")
+        previous_outputs = {}
+
+    for tx_id, outpoints in spent_outpoints.items():
+        for outpoint in outpoints:
+            if outpoint in NOTIFIED_OUTPUT_ADDRESSES:
+                tx_addresses[tx_id].add(NOTIFIED_OUTPUT_ADDRESSES[outpoint])
+            elif outpoint in previous_outputs:
+                address = previous_outputs[outpoint]["script_public_key_address"]
+                tx_addresses[tx_id].add(address)
+
+    await _evict_balances(set().union(*tx_addresses.values()))
+
+
+async def on_virtual_chain_changed(notification):
+    """
+    Evicts the balances changed by the transactions the new chain blocks accepted
+    """
+    addresses = set()
+
+    for accepted in notification.get("acceptedTransactionIds", []):
+        for tx_id in accepted.get("acceptedTransactionIds", []):
+            addresses |= NOTIFIED_TX_ADDRESSES.pop(tx_id, set())
 
-    # return 0 if address is ok, but no utxos there
-    except KeyError:
-        balance = 0
+    await _evict_balances(addresses)
 
-    return balance
+
+notifications.block_added += on_block_added
+notifications.virtual_chain_changed += on_virtual_chain_changed
 
 
 @app.get(
@@ -169,11 +291,13 @@ async def get_kaspa_address_info(
     """
     Get balance for a given kaspa address
     """
-    balance = await get_address_balance(address=kaspaAddress)
-    tags = await get_address_tags(address=kaspaAddress)
-    balance_records = await get_addresses_balance_records(
-        addresses=[kaspaAddress],
-        limit=24 * 7,  # assuming job runs every hour, returns 7 days of data
+    balance, tags, balance_records = await asyncio.gather(
+        get_address_balance(address=kaspaAddress),
+        get_address_tags(address=kaspaAddress),
+        get_addresses_balance_records(
+            addresses=[kaspaAddress],
+            limit=24 * 7,  # assuming job runs every hour, returns 7 days of data
+        ),
     )
 
     return {
@@ -202,135 +326,148 @@ async def get_transactions_for_address(
         default=10,
     ),
     offset: int = Query(
-        description="The offset from which to get records", ge=0, default=0
+        description="The offset from which to get records. Slow for deep pages, "
+        "prefer before / after",
+        ge=0,
+        default=0,
+    ),
+    before: str | None = Query(
+        description="Cursor (next_cursor of a previous page), returns the "
+        "transactions older than it",
+        default=None,
+    ),
+    after: str | None = Query(
+        description="Cursor (previous_cursor of a previous page), returns the "
+        "transactions newer than it",
+        default=None,
     ),
     fields: str = "",
 ):
-    transactions = await get_transactions_for_address_local(
-        kaspaAddress=kaspaAddress, limit=limit, offset=offset, fields=fields
+    """
+    Get transactions for a given address, newest first. Walk the history with the
+    before / after cursors, each page then costs the same regardless of its depth.
+    """
+    if before and after:
+        raise HTTPException(
+            status_code=400, detail="Use either before or after, not both"
+        )
+
+    (transactions, next_cursor, previous_cursor), (total, total_is_estimated) = (
+        await asyncio.gather(
+            get_transactions_for_address_local(
+                kaspaAddress=kaspaAddress,
+                limit=limit,
+                offset=offset,
+                fields=fields,
+                before=before,
+                after=after,
+            ),
+            get_transaction_count_for_address(address=kaspaAddress),
+        )
+    )
+    return TransactionsResponse(
+        transactions=transactions,
+        total=total,
+        total_is_estimated=total_is_estimated,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
     )
-    transaction_count = await get_transaction_count_for_address(address=kaspaAddress)
-    return TransactionsResponse(transactions=transactions, total=transaction_count)
 
 
 async def get_transactions_for_address_local(
-    kaspaAddress: str, limit: int, offset: int, fields: str = ""
+    kaspaAddress: str,
+    limit: int,
+    offset: int,
+    fields: str = "",
+    before: str | None = None,
+    after: str | None = None,
 ):
     """
-    Get all transactions for a given address from database
+    Get a page of transactions for a given address from database, together with
+    the cursors of its oldest and newest entry
     """
-    async with async_session() as s:
-        # This query is slow with pagination
-        await s.execute("SET LOCAL statement_timeout TO '10s';")
-
-        # Doing it this way as opposed to adding it directly in the IN clause
-        # so I can re-use the same result in tx_list, TxInput and TxOutput
-        tx_within_limit_offset = await s.execute(
-            select(TxAddrMapping.transaction_id)
-            .filter(TxAddrMapping.address == kaspaAddress)
-            .limit(limit)
-            .offset(offset)
-            .order_by(TxAddrMapping.block_time.desc())
-        )
+    # Keyset pagination: an index range scan on (address, block_time, id) from the
+    # cursor on. Offset pagination has to skip every row before the page.
+    page = await dbqueries.fetch_address_transaction_page(
+        kaspaAddress,
+        limit,
+        offset,
+        before=decode_cursor(before) if before else None,
+        after=decode_cursor(after) if after else None,
+    )
 
-        tx_ids_in_page = [x[0] for x in tx_within_limit_offset.all()]
+    if not page:
+        return [], None, None
 
-    return await search_for_transactions_local(
-        transactionIds=tx_ids_in_page, fields=fields
+    transactions = await search_for_transactions_local(
+        transactionIds=[x["transaction_id"] for x in page], fields=fields
+    )
+
+    return (
+        transactions,
+        encode_cursor(page[-1]["block_time"], page[-1]["id"]),
+        encode_cursor(page[0]["block_time"], page[0]["id"]),
     )
 
 
 async def search_for_transactions_local(transactionIds: List[str], fields: str = ""):
     fields = fields.split(",") if fields else []
 
-    async with async_session() as s:
-        tx_list = await s.execute(
-            select(Transaction, Block.blue_score)
-            .join(Block, Transaction.accepting_block_hash == Block.hash, isouter=True)
-            .filter(Transaction.transaction_id.in_(transactionIds))
-            .order_by(Transaction.block_time.desc())
-        )
-
-        tx_list = tx_list.all()
-
-        if not fields or "inputs" in fields:
-            tx_inputs = await s.execute(
-                select(TransactionInput).filter(
-                    TransactionInput.transaction_id.in_(transactionIds)
-                )
-            )
-            tx_inputs = tx_inputs.scalars().all()
-
-            # Fetch input txns
-            previous_outpoint_txns = await s.execute(
-                select(TransactionOutput).where(
-                    TransactionOutput.transaction_id.in_(
-                        [tx_inp.previous_outpoint_hash for tx_inp in tx_inputs]
-                    )
-                )
-            )
-
-            previous_outpoint_txns = previous_outpoint_txns.scalars().all()
-            previous_outpoint_txn_map = {}
-            for tx in previous_outpoint_txns:
-                if tx.transaction_id not in previous_outpoint_txn_map:
-                    previous_outpoint_txn_map[tx.transaction_id] = {}
-                previous_outpoint_txn_map[tx.transaction_id][tx.index] = tx
-        else:
-            tx_inputs = []
+    tx_list, tx_inputs, tx_outputs, blue_score = await asyncio.gather(
+        dbqueries.fetch_transactions(transactionIds),
+        dbqueries.fetch_inputs(
+            transactionIds if not fields or "inputs" in fields else []
+        ),
+        dbqueries.fetch_outputs(
+            transactionIds if not fields or "outputs" in fields else []
+        ),
+        get_virtual_selected_parent_blue_score(),
+    )
+    previous_outputs = await dbqueries.fetch_previous_outputs(tx_inputs)
 
-        if not fields or "outputs" in fields:
-            tx_outputs = await s.execute(
-                select(TransactionOutput).filter(
-                    TransactionOutput.transaction_id.in_(transactionIds)
-                )
-            )
-            tx_outputs = tx_outputs.scalars().all()
-        else:
-            tx_outputs = []
+    outputs_by_tx = group_by_transaction_id(tx_outputs)
+    inputs_by_tx = group_by_transaction_id(tx_inputs)
 
-    blue_score = (await get_virtual_selected_parent_blue_score()).get("blueScore", 0)
+    # the rows come straight from the database, the response model validates
+    # them once on the way out
+    blue_score = blue_score.get("blueScore", 0)
     return list(
         (
             filter_fields(
                 {
-                    "subnetwork_id": tx.Transaction.subnetwork_id,
-                    "transaction_id": tx.Transaction.transaction_id,
-                    "hash": tx.Transaction.hash,
-                    "mass": tx.Transaction.mass,
-                    "block_hash": tx.Transaction.block_hash,
-                    "block_time": tx.Transaction.block_time,
-                    "is_accepted": tx.Transaction.is_accepted,
-                    "confirmations": int(blue_score) - (tx.blue_score or 0),
-                    "accepting_block_hash": tx.Transaction.accepting_block_hash,
-                    "accepting_block_blue_score": tx.blue_score,
-                    "outputs": parse_obj_as(
-                        List[TxOutput],
-                        [
-                            x
-                            for x in tx_outputs
-                            if x.transaction_id == tx.Transaction.transaction_id
-                        ],
-                    ),
-                    "inputs": parse_obj_as(
-                        List[TxInput],
-                        [
-                            {
-                                **x.__dict__,
-                                "amount": previous_outpoint_txn_map[
-                                    x.previous_outpoint_hash
-                                ][x.previous_outpoint_index].amount,
-                                "script_public_key_address": previous_outpoint_txn_map[
-                                    x.previous_outpoint_hash
-                                ][x.previous_outpoint_index].script_public_key_address,
-                            }
-                            for x in tx_inputs
-                            if x.transaction_id == tx.Transaction.transaction_id
-                            and previous_outpoint_txn_map.get(
-                                x.previous_outpoint_hash, {}
-                            ).get(x.previous_outpoint_index)
-                        ],
-                    ),
+                    "subnetwork_id": tx["subnetwork_id"],
+                    "transaction_id": tx["transaction_id"],
+                    "hash": tx["hash"],
+                    "mass": tx["mass"],
+                    "block_hash": tx["block_hash"],
+                    "block_time": tx["block_time"],
+                    "is_accepted": tx["is_accepted"],
+                    "confirmations": int(blue_score)
+                    - (tx["accepting_block_blue_score"] or 0),
+                    "accepting_block_hash": tx["accepting_block_hash"],
+                    "accepting_block_blue_score": tx["accepting_block_blue_score"],
+                    "outputs": [
+                        TxOutput.construct(**x)
+                        for x in outputs_by_tx.get(tx["transaction_id"], [])
+                    ],
+                    "inputs": [
+                        TxInput.construct(
+                            **x,
+                            amount=previous_output["amount"],
+                            script_public_key_address=previous_output[
+                                "script_public_key_address"
+                            ],
+                        )
+                        for x in inputs_by_tx.get(tx["transaction_id"], [])
+                        if (
+                            previous_output := previous_outputs.get(
+                                (
+                                    x["previous_outpoint_hash"],
+                                    x["previous_outpoint_index"],
+                                )
+                            )
+                        )
+                    ],
                 },
                 fields,
             )
@@ -341,14 +478,35 @@ async def search_for_transactions_local(transactionIds: List[str], fields: str =
 
 async def get_transaction_count_for_address(address: str):
     """
-    Count the number of transactions associated with this address
+    Count the number of transactions associated with this address. Returns the
+    count and whether it is an estimate (its counter is still being backfilled).
     """
 
     async with async_session() as s:
+        try:
+            counter = (
+                await s.execute(
+                    select(AddressTxCount.tx_count, AddressTxCount.is_estimated).filter(
+                        AddressTxCount.address == address
+                    )
+                )
+            ).first()
+        except ProgrammingError as e:
+            # scripts/counters/address_tx_counts.sql not applied yet
+            if not is_undefined_table(e):
+                raise
+
+            await s.rollback()
+            counter = None
+
+        if counter is not None:
+            return counter.tx_count, counter.is_estimated
+
+        # no counter yet, e.g. before the backfill reached this address
         count_query = select(func.count()).filter(TxAddrMapping.address == address)
         tx_count = await s.execute(count_query)
 
-    return tx_count.scalar()
+    return tx_count.scalar(), False
 
 
 async def append_input_transactions_info(txs: list[dict[str, Any]]):
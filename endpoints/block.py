@@ -1,31 +1,54 @@
 # encoding: utf-8
+import asyncio
+import os
 
 from fastapi import Query, Path, HTTPException
 from fastapi import Response
-from sqlalchemy import select
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select, text
+from sqlalchemy.exc import ProgrammingError
 
-from dbsession import async_session
+import dbqueries
+from dbsession import async_session, is_undefined_table
 from endpoints.models import BlockModel, BlockResponse
 from endpoints.stats import get_virtual_selected_parent_blue_score
-from endpoints.utils import kaspadBlockToModel
+from endpoints.utils import group_by_transaction_id, kaspadBlockMessageToModel
+from helper.caches import LRUByteCache
+from helper.constants import FINALITY_CONFIRMATIONS
 from models.Block import Block
-from models.Transaction import Transaction, TransactionOutput, TransactionInput
+from models.BlockParent import BlockParent
 from server import app, kaspad_client
 
+# blocks deeper than FINALITY_CONFIRMATIONS, only the confirmations of their
+# transactions change and are computed on read
+finalized_blocks = LRUByteCache(
+    "finalized_blocks",
+    int(os.getenv("FINALIZED_BLOCK_CACHE_BYTES", 128 * 1024 * 1024)),
+)
+
 
 @app.get("/blocks/{blockId}", response_model=BlockModel, tags=["blocks"])
 async def get_block(response: Response, blockId: str = Path(regex="[a-f0-9]{64}")):
     """
     Get block information for a given block id
     """
+    cached_block = finalized_blocks.get(blockId)
+
+    if cached_block is not None:
+        response.headers["X-Data-Source"] = "Cache"
+        return with_confirmations(cached_block, await get_current_blue_score())
+
     resp = await kaspad_client.request(
-        "getBlockRequest", params={"hash": blockId, "includeTransactions": True}
+        "getBlockRequest",
+        params={"hash": blockId, "includeTransactions": True},
+        hedge=True,
+        raw=True,
     )
     requested_block = None
 
-    if "block" in resp["getBlockResponse"]:
+    if resp.getBlockResponse.HasField("block"):
         # We found the block in kaspad. Just use it
-        requested_block = kaspadBlockToModel(resp["getBlockResponse"]["block"])
+        requested_block = kaspadBlockMessageToModel(resp.getBlockResponse.block)
         response.headers["X-Data-Source"] = "Kaspad"
     else:
         # Didn't find the block in kaspad. Try getting it from the DB
@@ -44,9 +67,31 @@ async def get_block(response: Response, blockId: str = Path(regex="[a-f0-9]{64}"
             blockId, int(blue_score)
         )
 
+    block_blue_score = int(requested_block["header"]["blue_score"] or 0)
+    if await get_current_blue_score() - block_blue_score >= FINALITY_CONFIRMATIONS:
+        finalized_blocks.set(blockId, jsonable_encoder(requested_block))
+
     return requested_block
 
 
+async def get_current_blue_score():
+    return int((await get_virtual_selected_parent_blue_score()).get("blueScore", 0))
+
+
+def with_confirmations(block, blue_score):
+    """
+    Copy of a cached block with the confirmations of its transactions as of now
+    """
+    confirmations = blue_score - int(block["header"]["blue_score"] or 0)
+    return {
+        **block,
+        "transactions": [
+            {**tx, "confirmations": confirmations} if "confirmations" in tx else tx
+            for tx in block["transactions"] or []
+        ],
+    }
+
+
 @app.get("/blocks", response_model=BlockResponse, tags=["blocks"])
 async def get_blocks(
     lowHash: str = Query(regex="[a-f0-9]{64}"),
@@ -64,9 +109,15 @@ async def get_blocks(
             "includeBlocks": includeBlocks,
             "includeTransactions": includeTransactions,
         },
+        raw=True,
     )
 
-    return resp["getBlocksResponse"]
+    return {
+        "blockHashes": list(resp.getBlocksResponse.blockHashes),
+        "blocks": [
+            kaspadBlockMessageToModel(block) for block in resp.getBlocksResponse.blocks
+        ],
+    }
 
 
 """
@@ -76,14 +127,44 @@ Get the block from the database
 
 async def get_block_from_db(blockId):
     async with async_session() as s:
+        backfilling = "EXISTS (SELECT FROM block_parents_backfill)"
+
+        try:
+            children_hashes = (
+                (
+                    await s.execute(
+                        select(BlockParent.child_hash).filter(
+                            BlockParent.parent_hash == blockId
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
+        except ProgrammingError as e:
+            # scripts/mappings/block_parents.sql not applied yet, always scan
+            if not is_undefined_table(e):
+                raise
+
+            await s.rollback()
+            children_hashes, backfilling = [], "TRUE"
+
+        if not children_hashes:
+            # a tip, unless the block_parents backfill is still running (see
+            # scripts/mappings/block_parents.sql). The scan only runs then.
+            sql = f"""
+                SELECT hash
+                FROM blocks
+                WHERE {backfilling}
+                    AND parents @> ARRAY[:block_hash]::VARCHAR[]
+            """
+            children_hashes = (
+                (await s.execute(text(sql), {"block_hash": blockId})).scalars().all()
+            )
+
         requested_block = await s.execute(
             select(Block).where(Block.hash == blockId).limit(1)
         )
-        children_blocks = (
-            (await s.execute(select(Block).filter(Block.parents.op("&&")([blockId]))))
-            .scalars()
-            .all()
-        )
 
         try:
             requested_block = requested_block.first()[0]  # type: Block
@@ -113,7 +194,7 @@ async def get_block_from_db(blockId):
                 "selected_parent_hash": requested_block.selected_parent_hash,
                 "transaction_ids": [],
                 "blue_score": requested_block.blue_score,
-                "children_hashes": [i.hash for i in children_blocks],
+                "children_hashes": children_hashes,
                 "merge_set_blues_hashes": requested_block.merge_set_blues_hashes,
                 "merge_set_reds_hashes": requested_block.merge_set_reds_hashes,
                 "is_chain_block": requested_block.is_chain_block,
@@ -130,94 +211,67 @@ Get the transactions associated with a block
 async def get_block_transactions(blockId, block_blue_score):
     # create tx data
     tx_list = []
-    blue_score = (await get_virtual_selected_parent_blue_score()).get("blueScore", 0)
-
-    async with async_session() as s:
-        transactions = await s.execute(
-            select(Transaction).filter(Transaction.block_hash.contains([blockId]))
-        )
-
-        transactions = transactions.scalars().all()
-
-        tx_outputs = await s.execute(
-            select(TransactionOutput).where(
-                TransactionOutput.transaction_id.in_(
-                    [tx.transaction_id for tx in transactions]
-                )
-            )
-        )
 
-        tx_outputs = tx_outputs.scalars().all()
+    transactions = await dbqueries.fetch_block_transactions(blockId)
+    transaction_ids = [tx["transaction_id"] for tx in transactions]
 
-        tx_inputs = await s.execute(
-            select(TransactionInput).where(
-                TransactionInput.transaction_id.in_(
-                    [tx.transaction_id for tx in transactions]
-                )
-            )
-        )
-
-        tx_inputs = tx_inputs.scalars().all()
-
-        # Fetch input address
-        previous_outpoint_txns = await s.execute(
-            select(TransactionOutput).where(
-                TransactionOutput.transaction_id.in_(
-                    [tx_inp.previous_outpoint_hash for tx_inp in tx_inputs]
-                )
-            )
-        )
+    tx_outputs, tx_inputs, blue_score = await asyncio.gather(
+        dbqueries.fetch_outputs(transaction_ids),
+        dbqueries.fetch_inputs(transaction_ids),
+        get_virtual_selected_parent_blue_score(),
+    )
+    previous_outputs = await dbqueries.fetch_previous_outputs(tx_inputs)
 
-        previous_outpoint_txns = previous_outpoint_txns.scalars().all()
-        previous_outpoint_txn_map = {}
-        for tx in previous_outpoint_txns:
-            if tx.transaction_id not in previous_outpoint_txn_map:
-                previous_outpoint_txn_map[tx.transaction_id] = {}
-            previous_outpoint_txn_map[tx.transaction_id][tx.index] = tx
+    outputs_by_tx = group_by_transaction_id(tx_outputs)
+    inputs_by_tx = group_by_transaction_id(tx_inputs)
 
+    blue_score = blue_score.get("blueScore", 0)
     confirmations = int(blue_score) - (block_blue_score or 0)
     for tx in transactions:
         tx_list.append(
             {
                 "inputs": [
                     {
-                        "transaction_id": tx.transaction_id,
-                        "index": tx_inp.index,
-                        "previous_outpoint_hash": tx_inp.previous_outpoint_hash,
-                        "previous_outpoint_index": tx_inp.previous_outpoint_index,
-                        "signature_script": tx_inp.signature_script,
-                        "amount": previous_outpoint_txn_map[
-                            tx_inp.previous_outpoint_hash
-                        ][tx_inp.previous_outpoint_index].amount,
-                        "script_public_key_address": previous_outpoint_txn_map[
-                            tx_inp.previous_outpoint_hash
-                        ][tx_inp.previous_outpoint_index].script_public_key_address,
+                        "transaction_id": tx["transaction_id"],
+                        "index": tx_inp["index"],
+                        "previous_outpoint_hash": tx_inp["previous_outpoint_hash"],
+                        "previous_outpoint_index": tx_inp["previous_outpoint_index"],
+                        "signature_script": tx_inp["signature_script"],
+                        "amount": previous_output["amount"],
+                        "script_public_key_address": previous_output[
+                            "script_public_key_address"
+                        ],
                     }
-                    for tx_inp in tx_inputs
-                    if tx_inp.transaction_id == tx.transaction_id
-                    and previous_outpoint_txn_map.get(
-                        tx_inp.previous_outpoint_hash, {}
-                    ).get(tx_inp.previous_outpoint_index)
+                    for tx_inp in inputs_by_tx.get(tx["transaction_id"], [])
+                    if (
+                        previous_output := previous_outputs.get(
+                            (
+                                tx_inp["previous_outpoint_hash"],
+                                tx_inp["previous_outpoint_index"],
+                            )
+                        )
+                    )
                 ],
                 "outputs": [
                     {
-                        "transaction_id": tx.transaction_id,
-                        "amount": tx_out.amount,
-                        "index": tx_out.index,
-                        "script_public_key": tx_out.script_public_key,
-                        "script_public_key_type": tx_out.script_public_key_type,
-                        "script_public_key_address": tx_out.script_public_key_address,
+                        "transaction_id": tx["transaction_id"],
+                        "amount": tx_out["amount"],
+                        "index": tx_out["index"],
+                        "script_public_key": tx_out["script_public_key"],
+                        "script_public_key_type": tx_out["script_public_key_type"],
+                        "script_public_key_address": tx_out[
+                            "script_public_key_address"
+                        ],
                     }
-                    for tx_out in tx_outputs
-                    if tx_out.transaction_id == tx.transaction_id
+                    for tx_out in outputs_by_tx.get(tx["transaction_id"], [])
                 ],
-                "subnetwork_id": tx.subnetwork_id,
-                "transaction_id": tx.transaction_id,
-                "hash": tx.hash,
-                "mass": tx.mass,
-                "block_hash": tx.block_hash,
-                "block_time": tx.block_time,
-                "is_accepted": tx.is_accepted,
+                "subnetwork_id": tx["subnetwork_id"],
+                "transaction_id": tx["transaction_id"],
+                "hash": tx["hash"],
+                "mass": tx["mass"],
+                "block_hash": tx["block_hash"],
+                "block_time": tx["block_time"],
+                "is_accepted": tx["is_accepted"],
                 "confirmations": confirmations,
             }
         )
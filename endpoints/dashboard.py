@@ -13,6 +13,7 @@ from endpoints.models import (
     WhaleMovementResponse,
 )
 from endpoints.transaction import get_transaction
+from helper import notifications
 from helper.constants import KASPA_HASH_LENGTH, PRECISION
 from server import app, kaspad_client, memory_cache
 from dbsession import async_session
@@ -26,10 +27,10 @@ from endpoints.stats import (
 )
 
 from server import app, kaspad_client
-from cache import AsyncTTL
+from helper.caches import AsyncSWR, AsyncTTL
 
 
-@AsyncTTL(time_to_live=60 * 60)
+@AsyncTTL(time_to_live=60 * 60, maxsize=1)
 async def _get_max_tps():
     sql = f"""
                 SELECT
@@ -50,7 +51,7 @@ async def _get_max_tps():
     return resp[0]
 
 
-@AsyncTTL(time_to_live=60 * 60)
+@AsyncTTL(time_to_live=60 * 60, maxsize=1)
 async def _get_tps():
     sql = f"""
                 SELECT
@@ -69,7 +70,7 @@ async def _get_tps():
     return resp[0]
 
 
-@AsyncTTL(time_to_live=60 * 60)
+@AsyncTTL(time_to_live=60 * 60, maxsize=1)
 async def _get_bps():
     sql = f"""
                 SELECT
@@ -88,12 +89,19 @@ async def _get_bps():
     return resp[0]
 
 
-@AsyncTTL(time_to_live=5)
+@AsyncTTL(time_to_live=60, maxsize=1, shared=True)
 async def _get_block_dag_info():
     return await kaspad_client.request("getBlockDagInfoRequest")
 
 
-@AsyncTTL(time_to_live=5 * 60)
+async def on_block_added(block):
+    await _get_block_dag_info.invalidate()
+
+
+notifications.block_added += on_block_added
+
+
+@AsyncTTL(time_to_live=5 * 60, maxsize=1)
 async def _get_max_hashrate():
     sql = f"""
                 SELECT
@@ -151,7 +159,7 @@ async def get_dashboard_metrics(use_cache: bool = True):
     )
 
 
-@AsyncTTL(time_to_live=5 * 60)
+@AsyncSWR(time_to_live=5 * 60, max_staleness=10 * 60, maxsize=1, shared=True)
 async def _get_market_data():
     async with httpx.AsyncClient() as client:
         resp = await client.get(
@@ -190,7 +198,7 @@ async def get_market_data():
     return await _get_market_data()
 
 
-@AsyncTTL(time_to_live=3 * 60)
+@AsyncTTL(time_to_live=3 * 60, maxsize=1, shared=True)
 async def _get_whale_movement():
     sql = f"""
                 SELECT
@@ -281,7 +289,7 @@ async def _get_tx_count_graph():
     return result
 
 
-@AsyncTTL(time_to_live=30 * 60)
+@AsyncSWR(time_to_live=30 * 60, max_staleness=30 * 60, maxsize=1, shared=True)
 async def _get_dashboard_graphs():
     active_address_graph = await _get_active_address_graph()
     tx_count_graph = await _get_tx_count_graph()
@@ -11,29 +11,51 @@ from endpoints.models import (
 
 from sqlalchemy import select
 from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
 
-from dbsession import async_session
+from dbsession import async_session, is_undefined_table
 from endpoints.stats import get_coinsupply
 from models.AddressBalance import AddressBalance
 from server import app
 from sqlalchemy import func
-from cache import AsyncTTL
+from helper.caches import AsyncSWR, AsyncTTL
 
 import calendar
 
 
-@AsyncTTL(time_to_live=30 * 60)
+@AsyncSWR(time_to_live=60, max_staleness=10 * 60, maxsize=1, shared=True)
 async def get_total_holders():
+    """
+    Number of addresses with a non-zero balance, from the counter maintained by
+    scripts/counters/holders_count.sql plus its not yet folded deltas. Counts the
+    balances instead while that script is not applied or has not initialized the row.
+    """
+    sql = f"""
+                SELECT
+                    holders + (SELECT COALESCE(SUM(delta), 0) FROM holders_count_deltas)
+                FROM holders_count
+            """
+
     async with async_session() as s:
-        await s.execute("SET LOCAL statement_timeout TO '10s';")
+        try:
+            holders = (await s.execute(text(sql))).scalar()
+        except ProgrammingError as e:
+            if not is_undefined_table(e):
+                raise
+
+            await s.rollback()
+            holders = None
+
+        if holders is None:
+            await s.execute("SET LOCAL statement_timeout TO '10s';")
 
-        count_query = select(func.count()).filter(AddressBalance.balance > 0)
-        tx_count = await s.execute(count_query)
+            count_query = select(func.count()).filter(AddressBalance.balance > 0)
+            holders = (await s.execute(count_query)).scalar()
 
-    return tx_count.scalar()
+    return holders
 
 
-@AsyncTTL(time_to_live=30 * 60)
+@AsyncSWR(time_to_live=30 * 60, max_staleness=30 * 60, maxsize=1, shared=True)
 async def _get_holders_overview():
     sql = f"""
                 SELECT  
@@ -87,7 +109,7 @@ async def get_holders_overview():
     return await _get_holders_overview()
 
 
-@AsyncTTL(time_to_live=30 * 60)
+@AsyncTTL(time_to_live=30 * 60, maxsize=1)
 async def _get_holders_list():
     sql = f"""
                 SELECT  
@@ -146,7 +168,7 @@ def get_pct_change(prev, now):
         return 0
 
 
-@AsyncTTL(time_to_live=30 * 60)
+@AsyncTTL(time_to_live=30 * 60, maxsize=1)
 async def _get_distribution_trend_chart():
     columns = [f"addresses_in_1e{i}" for i in range(2, 11)]
     sql = f"""
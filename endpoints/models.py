@@ -64,16 +64,35 @@ class BlockdagResponse(BaseModel):
 
 class KaspadResponse(BaseModel):
     kaspadHost: str
-    serverVersion: str
-    isUtxoIndexed: bool
-    isSynced: bool
-    p2pId: str
+    serverVersion: str | None
+    isUtxoIndexed: bool | None
+    isSynced: bool | None
+    p2pId: str | None
+    state: str | None
+    circuitBreaker: str
+    errorRate: float
 
 
 class HealthResponse(BaseModel):
     kaspadServers: List[KaspadResponse]
 
 
+class CacheMetricsModel(BaseModel):
+    name: str
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    sharedHits: int | None
+    bytes: int | None
+    maxBytes: int | None
+
+
+class CacheMetricsResponse(BaseModel):
+    caches: List[CacheMetricsModel]
+
+
 class CoinSupplyResponse(BaseModel):
     circulatingSupply: str
     maxSupply: str
@@ -194,6 +213,9 @@ class TxModel(BaseModel):
 class TransactionsResponse(BaseModel):
     transactions: List[TxModel]
     total: int
+    total_is_estimated: bool | None
+    next_cursor: str | None
+    previous_cursor: str | None
 
 
 class VerboseDataModel(BaseModel):
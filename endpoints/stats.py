@@ -6,17 +6,23 @@ import hashlib
 from endpoints.models import (
     BlockRewardResponse,
     BlockdagResponse,
+    CacheMetricsResponse,
     CoinSupplyResponse,
     HealthResponse,
     NetworkResponse,
 )
-from server import app, kaspad_client
+from server import app, kaspad_client, memory_cache
 
+from helper import notifications
 from helper.deflationary_table import DEFLATIONARY_TABLE
-from cache import AsyncTTL
+from helper.caches import AsyncTTL, cache_metrics
 
 PREFIX = "info"
 
+# kaspad pushes the virtual blue score about every second. If no push came for
+# this long (stream down), it is fetched from kaspad instead.
+VIRTUAL_BLUE_SCORE_MAX_AGE = 5
+
 
 @app.get(
     f"/{PREFIX}/blockdag", response_model=NetworkResponse, tags=["Kaspa network info"]
@@ -54,11 +60,18 @@ async def get_blockreward(stringOnly: bool = False):
     return _get_block_reward(resp["getBlockDagInfoResponse"])
 
 
-@AsyncTTL(time_to_live=5)
+@AsyncTTL(time_to_live=60, maxsize=1, shared=True)
 async def _get_coin_supply():
     return await kaspad_client.request("getCoinSupplyRequest")
 
 
+async def on_virtual_chain_changed(notification):
+    await _get_coin_supply.invalidate()
+
+
+notifications.virtual_chain_changed += on_virtual_chain_changed
+
+
 @app.get(
     f"/{PREFIX}/coinsupply",
     response_model=CoinSupplyResponse,
@@ -125,8 +138,27 @@ async def get_virtual_selected_parent_blue_score():
     """
     Returns the blue score of virtual selected parent
     """
-    resp = await kaspad_client.request("getVirtualSelectedParentBlueScoreRequest")
-    return resp["getVirtualSelectedParentBlueScoreResponse"]
+    blue_score, updated_at = memory_cache.get("virtual_blue_score", (None, 0))
+
+    if time.monotonic() - updated_at > VIRTUAL_BLUE_SCORE_MAX_AGE:
+        resp = await kaspad_client.request(
+            "getVirtualSelectedParentBlueScoreRequest", raw=True
+        )
+        blue_score = resp.getVirtualSelectedParentBlueScoreResponse.blueScore
+        set_virtual_blue_score(blue_score)
+
+    return {"blueScore": blue_score}
+
+
+def set_virtual_blue_score(blue_score):
+    memory_cache["virtual_blue_score"] = (blue_score, time.monotonic())
+
+
+async def on_virtual_blue_score_changed(blue_score):
+    set_virtual_blue_score(blue_score)
+
+
+notifications.virtual_blue_score_changed += on_virtual_blue_score_changed
 
 
 @app.get(
@@ -134,10 +166,9 @@ async def get_virtual_selected_parent_blue_score():
 )
 async def health_state():
     """
-    Returns the current hashrate for Kaspa network in TH/s.
+    Returns the health state of the connected kaspads, as last seen by the
+    background prober.
     """
-    await kaspad_client.initialize_all()
-
     kaspads = []
 
     for i, kaspad_info in enumerate(kaspad_client.kaspads):
@@ -145,10 +176,30 @@ async def health_state():
             {
                 "isSynced": kaspad_info.is_synced,
                 "isUtxoIndexed": kaspad_info.is_utxo_indexed,
-                "p2pId": hashlib.sha256(kaspad_info.p2p_id.encode()).hexdigest(),
+                "p2pId": (
+                    hashlib.sha256(kaspad_info.p2p_id.encode()).hexdigest()
+                    if kaspad_info.p2p_id
+                    else None
+                ),
                 "kaspadHost": f"KASPAD_HOST_{i + 1}",
                 "serverVersion": kaspad_info.server_version,
+                "state": kaspad_info.state,
+                "circuitBreaker": kaspad_info.circuit_breaker.state,
+                "errorRate": kaspad_info.circuit_breaker.error_rate,
             }
         )
 
     return {"kaspadServers": kaspads}
+
+
+@app.get(
+    f"/{PREFIX}/cache-metrics",
+    response_model=CacheMetricsResponse,
+    response_model_exclude_none=True,
+    tags=["Kaspa network info"],
+)
+async def get_cache_metrics():
+    """
+    Size, hit, miss and eviction counters of the in-memory caches of this worker
+    """
+    return {"caches": cache_metrics()}
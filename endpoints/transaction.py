@@ -1,45 +1,25 @@
 # encoding: utf-8
-from sqlalchemy import or_
-from operator import and_
-from typing import List
-from functools import reduce
-
+import asyncio
+import os
 
 from fastapi import Path, HTTPException
-from pydantic import parse_obj_as
-from sqlalchemy.future import select
+from fastapi.encoders import jsonable_encoder
 
-from dbsession import async_session
+import dbqueries
 from endpoints.address import append_input_transactions_info
 from endpoints.models import TxInput, TxModel, TxOutput
 from endpoints.stats import get_virtual_selected_parent_blue_score
-from models.Block import Block
-from models.Transaction import Transaction, TransactionOutput, TransactionInput
+from helper.caches import LRUByteCache
+from helper.constants import FINALITY_CONFIRMATIONS
 from server import app
 
-
-async def _get_spent_tx_hashes(previous_outpoints: List[tuple[str, int]]):
-    conditions = []
-    for i in previous_outpoints:
-        conditions.append(
-            and_(
-                TransactionInput.previous_outpoint_hash == i[0],
-                TransactionInput.previous_outpoint_index == i[1],
-            )
-        )
-
-    async with async_session() as s:
-        filter_condition = or_(*conditions)
-        tx_inputs = await s.execute(select(TransactionInput).filter(filter_condition))
-        tx_inputs = tx_inputs.scalars().all()
-
-    result = {}
-    for spent_input in tx_inputs:
-        result[
-            (spent_input.previous_outpoint_hash, spent_input.previous_outpoint_index)
-        ] = spent_input.transaction_id
-
-    return result
+# transactions accepted deeper than FINALITY_CONFIRMATIONS, without the spent
+# hashes of their outputs. Those and the confirmations still change and are
+# looked up on read.
+finalized_txs = LRUByteCache(
+    "finalized_transactions",
+    int(os.getenv("FINALIZED_TX_CACHE_BYTES", 64 * 1024 * 1024)),
+)
 
 
 async def _get_transaction_local(
@@ -50,64 +30,45 @@ async def _get_transaction_local(
     """
     Get tx information for a given tx id
     """
-    async with async_session() as s:
-        tx = await s.execute(
-            select(Transaction, Block.blue_score)
-            .join(Block, Transaction.accepting_block_hash == Block.hash, isouter=True)
-            .filter(Transaction.transaction_id == transactionId)
-        )
-
-        tx = tx.first()
-
-        tx_outputs = None
-        tx_inputs = None
-
-        if outputs:
-            tx_outputs = await s.execute(
-                select(TransactionOutput).filter(
-                    TransactionOutput.transaction_id == transactionId
-                )
-            )
-
-            tx_outputs = tx_outputs.scalars().all()
-
-            # Fetch output spent hashes
-            spent_tx_hashes = await _get_spent_tx_hashes(
-                [(i.transaction_id, i.index) for i in tx_outputs]
-            )
-            for output in tx_outputs:
-                output.spent_tx_hash = spent_tx_hashes.get(
-                    (
-                        output.transaction_id,
-                        output.index,
-                    ),
-                )
-
-        if inputs:
-            tx_inputs = await s.execute(
-                select(TransactionInput).filter(
-                    TransactionInput.transaction_id == transactionId
-                )
-            )
-            tx_inputs = tx_inputs.scalars().all()
+    tx, tx_outputs, tx_inputs = await asyncio.gather(
+        dbqueries.fetch_transactions([transactionId]),
+        dbqueries.fetch_outputs([transactionId] if outputs else []),
+        dbqueries.fetch_inputs([transactionId] if inputs else []),
+    )
 
     if tx:
-        blue_score = (await get_virtual_selected_parent_blue_score()).get(
-            "blueScore", 0
+        tx = tx[0]
+
+        # Fetch output spent hashes
+        spent_tx_hashes, blue_score = await asyncio.gather(
+            dbqueries.fetch_spent_tx_hashes(
+                [(o["transaction_id"], o["index"]) for o in tx_outputs]
+            ),
+            get_virtual_selected_parent_blue_score(),
         )
+        blue_score = blue_score.get("blueScore", 0)
+
         tx = {
-            "subnetwork_id": tx.Transaction.subnetwork_id,
-            "transaction_id": tx.Transaction.transaction_id,
-            "hash": tx.Transaction.hash,
-            "mass": tx.Transaction.mass,
-            "block_hash": tx.Transaction.block_hash,
-            "block_time": tx.Transaction.block_time,
-            "is_accepted": tx.Transaction.is_accepted,
-            "confirmations": int(blue_score) - (tx.blue_score or 0),
-            "accepting_block_hash": tx.Transaction.accepting_block_hash,
-            "accepting_block_blue_score": tx.blue_score,
-            "outputs": parse_obj_as(List[TxOutput], tx_outputs) if tx_outputs else [],
-            "inputs": parse_obj_as(List[TxInput], tx_inputs) if tx_inputs else [],
+            "subnetwork_id": tx["subnetwork_id"],
+            "transaction_id": tx["transaction_id"],
+            "hash": tx["hash"],
+            "mass": tx["mass"],
+            "block_hash": tx["block_hash"],
+            "block_time": tx["block_time"],
+            "is_accepted": tx["is_accepted"],
+            "confirmations": int(blue_score) - (tx["accepting_block_blue_score"] or 0),
+            "accepting_block_hash": tx["accepting_block_hash"],
+            "accepting_block_blue_score": tx["accepting_block_blue_score"],
+            "outputs": [
+                TxOutput.construct(
+                    **o,
+                    spent_tx_hash=spent_tx_hashes.get(
+                        (o["transaction_id"], o["index"])
+                    ),
+                )
+                for o in tx_outputs
+            ],
+            "inputs": [TxInput.construct(**i) for i in tx_inputs],
         }
         return (await append_input_transactions_info([tx]))[0]
     else:
@@ -125,6 +86,42 @@ async def get_transaction(
     inputs: bool = True,
     outputs: bool = True,
 ):
-    return await _get_transaction_local(
-        transactionId=transactionId, inputs=inputs, outputs=outputs
+    key = (transactionId, inputs, outputs)
+    tx = finalized_txs.get(key)
+
+    if tx is None:
+        tx = await _get_transaction_local(
+            transactionId=transactionId, inputs=inputs, outputs=outputs
+        )
+
+        if (
+            tx["accepting_block_blue_score"] is not None
+            and tx["confirmations"] >= FINALITY_CONFIRMATIONS
+        ):
+            tx_json = jsonable_encoder(tx, exclude_unset=True)
+            for output in tx_json["outputs"]:
+                output.pop("spent_tx_hash", None)
+
+            finalized_txs.set(key, tx_json)
+
+        return tx
+
+    spent_tx_hashes, blue_score = await asyncio.gather(
+        dbqueries.fetch_spent_tx_hashes(
+            [(o["transaction_id"], o["index"]) for o in tx["outputs"]]
+        ),
+        get_virtual_selected_parent_blue_score(),
     )
+    blue_score = blue_score.get("blueScore", 0)
+
+    return {
+        **tx,
+        "confirmations": int(blue_score) - tx["accepting_block_blue_score"],
+        "outputs": [
+            {
+                **o,
+                "spent_tx_hash": spent_tx_hashes.get((o["transaction_id"], o["index"])),
+            }
+            for o in tx["outputs"]
+        ],
+    }
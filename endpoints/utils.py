@@ -1,4 +1,9 @@
+import base64
+import binascii
 import re
+from collections import defaultdict
+
+from fastapi import HTTPException
 
 
 def to_snake(name):
@@ -17,9 +22,70 @@ def camel_to_snake_case_deep(d):
     }
 
 
-def kaspadBlockToModel(block: object):
+def group_by_transaction_id(rows):
+    """
+    Groups tx_inputs / tx_outputs rows by their transaction_id in a single pass
+    """
+    grouped = defaultdict(list)
+
+    for row in rows:
+        grouped[row["transaction_id"]].append(row)
+
+    return grouped
+
+
+def encode_cursor(block_time, row_id):
+    """
+    Opaque pagination cursor for a (block_time, id) position
+    """
+    return base64.urlsafe_b64encode(f"{block_time}:{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    try:
+        block_time, row_id = base64.urlsafe_b64decode(cursor.encode()).split(b":")
+        return int(block_time), int(row_id)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def kaspadBlockMessageToModel(block):
+    """
+    Block as the response models expect it, read directly from the RpcBlock
+    protobuf instead of a MessageToDict result. 64 bit numbers stay ints, the
+    response models turn them into strings where needed.
+    """
+    header = block.header
+    verbose_data = block.verboseData
+
     return {
-        "header": camel_to_snake_case_deep(block["header"]),
+        "header": {
+            "version": header.version,
+            "parents": [
+                {"parent_hashes": list(p.parentHashes)} for p in header.parents
+            ],
+            "hash_merkle_root": header.hashMerkleRoot,
+            "accepted_id_merkle_root": header.acceptedIdMerkleRoot,
+            "utxo_commitment": header.utxoCommitment,
+            "timestamp": header.timestamp,
+            "bits": header.bits,
+            "nonce": header.nonce,
+            "daa_score": header.daaScore,
+            "blue_work": header.blueWork,
+            "pruning_point": header.pruningPoint,
+            "blue_score": header.blueScore,
+        },
         "transactions": None,
-        "verbose_data": camel_to_snake_case_deep(block["verboseData"]),
+        "verbose_data": {
+            "hash": verbose_data.hash,
+            "difficulty": verbose_data.difficulty,
+            "selected_parent_hash": verbose_data.selectedParentHash,
+            "transaction_ids": list(verbose_data.transactionIds),
+            "is_header_only": verbose_data.isHeaderOnly,
+            "blue_score": verbose_data.blueScore,
+            "children_hashes": list(verbose_data.childrenHashes),
+            "merge_set_blues_hashes": list(verbose_data.mergeSetBluesHashes),
+            "merge_set_reds_hashes": list(verbose_data.mergeSetRedsHashes),
+            "is_chain_block": verbose_data.isChainBlock,
+        },
     }
@@ -1,3 +1,14 @@
+import asyncio
+import functools
+import logging
+import time
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 10  # listener runs per AsyncEvent at once
+DEFAULT_MAX_PENDING = 1000  # started listener runs per AsyncEvent
+
+
 class Event(object):
     def __init__(self):
         self.callbacks = set()
@@ -31,3 +42,71 @@ class LockableEvent(Event):
 
     def unlock(self):
         self._lock = False
+
+
+class AsyncEvent(LockableEvent):
+    """
+    Event for coroutine listeners. Publishing starts every listener as a background
+    task with the published arguments as they are and returns right away, so slow
+    listeners do not hold up the publisher.
+
+    At most max_concurrency listener runs of the event go at once, the others wait
+    in order. Beyond max_pending started runs, new ones are dropped. A failing
+    listener is logged and does not affect the others.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        super().__init__()
+        self.max_pending = max_pending
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__tasks = set()
+
+    async def __call__(self, *args, **kwargs):
+        if self._lock:
+            return
+
+        for callback in list(self.callbacks):
+            if len(self.__tasks) >= self.max_pending:
+                _logger.warning(
+                    f"Event listener {callback.__name__} is behind, dropped"
+                )
+                continue
+
+            task = asyncio.create_task(self.__run(callback, args, kwargs))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    async def __run(self, callback, args, kwargs):
+        async with self.__semaphore:
+            try:
+                await callback(*args, **kwargs)
+            except Exception:
+                _logger.exception(f"Event listener {callback.__name__} failed")
+
+
+def throttled(interval):
+    """
+    Drops calls of an async listener which come in less than `interval` seconds
+    after the last one that ran.
+    """
+
+    def decorator(func):
+        last_run = 0
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            nonlocal last_run
+
+            if time.monotonic() - last_run < interval:
+                return
+
+            last_run = time.monotonic()
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,353 @@
+# encoding: utf-8
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+
+from helper.shared_cache import shared_key, shared_tier
+
+_logger = logging.getLogger(__name__)
+
+# name -> cache, every cache of the process. Their counters are exposed by
+# /info/cache-metrics.
+CACHES = {}
+
+
+def cache_metrics():
+    return [c.metrics() for c in CACHES.values()]
+
+
+def normalize(value):
+    """
+    Hashable, order-independent form of a cache key argument
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(v) for v in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(normalize(v) for v in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, normalize(v)) for k, v in value.items()))
+
+    return value
+
+
+def make_key(signature: inspect.Signature, args, kwargs):
+    """
+    Cache key of a call, the same for positional, keyword and defaulted arguments:
+    f("a"), f(address="a") and f("a", limit=1) (with limit=1 the default) match.
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple((k, normalize(v)) for k, v in bound.arguments.items())
+
+
+class MeteredCache(object):
+    """
+    Registers the cache under its name and counts hits, misses and evictions
+    """
+
+    def __init__(self, name: str):
+        if name in CACHES:
+            raise ValueError(f"Cache {name!r} exists already")
+
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        CACHES[name] = self
+
+    def metrics(self):
+        return {
+            "name": self.name,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class LRUByteCache(MeteredCache):
+    """
+    LRU cache bounded by the approximate size of its values in bytes (their JSON
+    encoding), not by their number, so a few huge blocks cannot blow up memory.
+    Values must be JSON-like (dicts, lists, str, numbers), see jsonable_encoder.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        super().__init__(name)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.__items = OrderedDict()  # key -> (value, size)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def metrics(self):
+        return {**super().metrics(), "bytes": self.size, "maxBytes": self.max_bytes}
+
+    def get(self, key, default=None):
+        try:
+            value, _ = self.__items[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.__items.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        size = len(json.dumps(value, separators=(",", ":"), default=str))
+
+        if size > self.max_bytes:
+            return
+
+        self.pop(key)
+        self.__items[key] = (value, size)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self.__items.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        try:
+            value, size = self.__items.pop(key)
+        except KeyError:
+            return default
+
+        self.size -= size
+        return value
+
+    def clear(self):
+        self.__items.clear()
+        self.size = 0
+
+
+class CachedFunction(MeteredCache):
+    """
+    Base of the cache decorators for async functions: an LRU dict of at most
+    maxsize entries, keyed by the normalized call arguments (see make_key). The
+    decorated function gets invalidate(*args, **kwargs) and clear_cache().
+
+    shared=True adds the shared tier of helper.shared_cache (if SHARED_CACHE_URL
+    is set) behind it: a worker missing an entry reads what another worker loaded
+    before calling the function. The values must survive a JSON round trip.
+    """
+
+    def __init__(
+        self,
+        time_to_live: float,
+        maxsize: int,
+        name: str | None = None,
+        shared: bool = False,
+    ):
+        self.time_to_live = time_to_live
+        self.maxsize = maxsize
+        self.shared = shared and shared_tier is not None
+        self.shared_hits = 0
+
+        self._name = name
+        self._entries = OrderedDict()  # key -> (value, loaded at)
+        # key -> [running loads, generation], only while loads of the key run.
+        # invalidate() bumps the generation, so loads started before do not store
+        # the value they got.
+        self._loads = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def metrics(self):
+        metrics = {**super().metrics(), "maxsize": self.maxsize}
+
+        if self.shared:
+            metrics["sharedHits"] = self.shared_hits
+
+        return metrics
+
+    async def invalidate(self, *args, **kwargs):
+        key = make_key(self._signature, args, kwargs)
+        self._entries.pop(key, None)
+
+        if key in self._loads:
+            self._loads[key][1] += 1
+
+        if self.shared:
+            try:
+                await shared_tier.delete(shared_key(self.name, key))
+            except Exception as e:
+                _logger.warning(f"Shared cache delete for {self.name} failed: {e!r}")
+
+    def clear_cache(self):
+        self._entries.clear()
+
+    def __call__(self, func):
+        super().__init__(self._name or f"{func.__module__}.{func.__qualname__}")
+        self._signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await self._get(
+                make_key(self._signature, args, kwargs), func, args, kwargs
+            )
+
+        wrapper.invalidate = self.invalidate
+        wrapper.clear_cache = self.clear_cache
+        return wrapper
+
+    async def _get(self, key, func, args, kwargs):
+        raise NotImplementedError
+
+    async def _load(self, key, func, args, kwargs):
+        load = self._loads.setdefault(key, [0, 0])
+        load[0] += 1
+        generation = load[1]
+
+        try:
+            return await self.__fetch(key, func, args, kwargs, load, generation)
+        finally:
+            load[0] -= 1
+            if load[0] == 0:
+                del self._loads[key]
+
+    async def __fetch(self, key, func, args, kwargs, load, generation):
+        if self.shared:
+            cached = await self.__shared_get(key)
+
+            if cached is not None:
+                value, expires_in = cached
+                self.shared_hits += 1
+
+                if load[1] == generation:
+                    self._store(key, value, age=max(0, self.time_to_live - expires_in))
+
+                return value
+
+        value = await func(*args, **kwargs)
+
+        # invalidated while loading, the value may be from before the change
+        if load[1] != generation:
+            return value
+
+        self._store(key, value)
+
+        if self.shared:
+            try:
+                await shared_tier.set(
+                    shared_key(self.name, key), value, self.time_to_live
+                )
+            except Exception as e:
+                _logger.warning(f"Shared cache write for {self.name} failed: {e!r}")
+
+        return value
+
+    async def __shared_get(self, key):
+        # the shared tier being down must not fail requests, the function is
+        # called instead
+        try:
+            return await shared_tier.get(shared_key(self.name, key))
+        except Exception as e:
+            _logger.warning(f"Shared cache read for {self.name} failed: {e!r}")
+            return None
+
+    def _age(self, key):
+        """
+        Age of the entry in seconds, None if there is none
+        """
+        entry = self._entries.get(key)
+        return None if entry is None else time.monotonic() - entry[1]
+
+    def _hit(self, key):
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def _store(self, key, value, age=0):
+        self._entries[key] = (value, time.monotonic() - age)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+class AsyncTTL(CachedFunction):
+    """
+    Cache decorator for async functions. Entries expire after time_to_live seconds,
+    the least recently used one is evicted beyond maxsize entries.
+    """
+
+    async def _get(self, key, func, args, kwargs):
+        age = self._age(key)
+
+        if age is not None and age < self.time_to_live:
+            return self._hit(key)
+
+        self.misses += 1
+        return await self._load(key, func, args, kwargs)
+
+
+class AsyncSWR(CachedFunction):
+    """
+    Stale-while-revalidate cache decorator for async functions.
+
+    fresh (younger than time_to_live):  served from cache
+    stale (up to max_staleness longer): served from cache, one background task
+                                        refreshes it
+    older or missing:                   callers wait for a load
+
+    Loads run once per key at a time, concurrent callers share the running one, so
+    an expiring entry never causes a stampede. A failed background refresh keeps
+    the stale value until max_staleness is over.
+    """
+
+    def __init__(
+        self,
+        time_to_live: float,
+        max_staleness: float,
+        maxsize: int,
+        name: str | None = None,
+        shared: bool = False,
+    ):
+        super().__init__(time_to_live, maxsize, name, shared)
+        self.max_staleness = max_staleness
+        self.__loading = {}  # key -> running load task
+
+    async def _get(self, key, func, args, kwargs):
+        age = self._age(key)
+
+        if age is not None and age < self.time_to_live:
+            return self._hit(key)
+
+        if age is not None and age < self.time_to_live + self.max_staleness:
+            self.__load(key, func, args, kwargs)
+            return self._hit(key)
+
+        self.misses += 1
+
+        # a cancelled caller must not cancel the load for the others
+        return await asyncio.shield(self.__load(key, func, args, kwargs))
+
+    def __load(self, key, func, args, kwargs):
+        task = self.__loading.get(key)
+
+        if task is None:
+            task = asyncio.create_task(self._load(key, func, args, kwargs))
+            task.add_done_callback(lambda t: self.__loaded(key, t))
+            self.__loading[key] = task
+
+        return task
+
+    def __loaded(self, key, task):
+        if self.__loading.get(key) is task:
+            del self.__loading[key]
+
+        if not task.cancelled() and task.exception() is not None:
+            _logger.warning(f"Loading {self.name} failed: {task.exception()!r}")
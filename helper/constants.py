@@ -2,3 +2,7 @@ PRECISION = 1e8
 WHALE_TX_THRESHHOLD = 1 * 1e6 * PRECISION
 
 KASPA_HASH_LENGTH = 64
+
+# blue score depth after which a block, or a transaction by its accepting block,
+# is final and never changes again (apart from its confirmation count)
+FINALITY_CONFIRMATIONS = 86400
@@ -0,0 +1,53 @@
+# encoding: utf-8
+from helper.Event import AsyncEvent
+
+# In-process fan-out of kaspad notifications. sockets.blocks.config() holds the
+# single kaspad subscription and publishes every notification to these events,
+# so caches and socket rooms can react to pushes instead of polling kaspad.
+#
+# listeners: async def on_block_added(block: dict): ...
+#            notifications.block_added += on_block_added
+
+block_added = AsyncEvent()  # RpcBlock as dict
+# VirtualSelectedParentChainChanged as dict, with acceptedTransactionIds
+virtual_chain_changed = AsyncEvent()
+virtual_daa_score_changed = AsyncEvent()  # virtual DAA score as int
+virtual_blue_score_changed = AsyncEvent()  # virtual selected parent blue score as int
+
+SUBSCRIPTIONS = [
+    "notifyBlockAddedRequest",
+    (
+        "notifyVirtualSelectedParentChainChangedRequest",
+        {"includeAcceptedTransactionIds": True},
+    ),
+    "notifyVirtualDaaScoreChangedRequest",
+    "notifyVirtualSelectedParentBlueScoreChangedRequest",
+]
+
+
+async def publish(notification: dict):
+    if "blockAddedNotification" in notification:
+        await block_added(notification["blockAddedNotification"]["block"])
+
+    elif "virtualSelectedParentChainChangedNotification" in notification:
+        await virtual_chain_changed(
+            notification["virtualSelectedParentChainChangedNotification"]
+        )
+
+    elif "virtualDaaScoreChangedNotification" in notification:
+        await virtual_daa_score_changed(
+            int(
+                notification["virtualDaaScoreChangedNotification"].get(
+                    "virtualDaaScore", 0
+                )
+            )
+        )
+
+    elif "virtualSelectedParentBlueScoreChangedNotification" in notification:
+        await virtual_blue_score_changed(
+            int(
+                notification["virtualSelectedParentBlueScoreChangedNotification"].get(
+                    "virtualSelectedParentBlueScore", 0
+                )
+            )
+        )
@@ -0,0 +1,90 @@
+# encoding: utf-8
+import hashlib
+import json
+import logging
+import os
+
+from fastapi.encoders import jsonable_encoder
+
+_logger = logging.getLogger(__name__)
+
+# e.g. redis://localhost:6379/0 or unix:///run/redis.sock. Unset: every worker
+# only has its own in-memory caches.
+SHARED_CACHE_URL = os.getenv("SHARED_CACHE_URL")
+KEY_PREFIX = "kaspa-rest-server:cache:"
+
+
+def serialize(value) -> bytes:
+    """
+    Values are stored as JSON, so they come back as plain dicts, lists, strings
+    and numbers. Cached helpers opting into the shared tier must return such
+    values (pydantic models and datetimes are converted by jsonable_encoder).
+    """
+    return json.dumps(jsonable_encoder(value), separators=(",", ":")).encode()
+
+
+def deserialize(data: bytes):
+    return json.loads(data)
+
+
+def shared_key(cache_name: str, key) -> str:
+    return KEY_PREFIX + cache_name + ":" + hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+class SharedCacheTier(object):
+    """
+    Cache storage shared by all workers, the second tier behind the in-memory
+    caches of helper.caches. get() returns (value, seconds until it expires), or
+    None if the key is missing.
+    """
+
+    async def get(self, key: str):
+        raise NotImplementedError
+
+    async def set(self, key: str, value, time_to_live: float):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+
+class RedisCacheTier(SharedCacheTier):
+    """
+    Any server speaking the Redis protocol (Redis, Valkey, KeyDB, ...), e.g. one
+    running next to the workers on the same host
+    """
+
+    def __init__(self, url: str):
+        import redis.asyncio
+
+        self.client = redis.asyncio.Redis.from_url(url)
+
+    async def get(self, key: str):
+        async with self.client.pipeline(transaction=False) as pipe:
+            data, expires_in_ms = await pipe.get(key).pttl(key).execute()
+
+        if data is None:
+            return None
+
+        return deserialize(data), max(0, expires_in_ms) / 1000
+
+    async def set(self, key: str, value, time_to_live: float):
+        await self.client.set(
+            key, serialize(value), px=max(1, int(time_to_live * 1000))
+        )
+
+    async def delete(self, key: str):
+        await self.client.delete(key)
+
+
+def create_shared_tier(url: str | None) -> SharedCacheTier | None:
+    if not url:
+        return None
+
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheTier(url)
+
+    raise ValueError(f"Unsupported SHARED_CACHE_URL {url!r}")
+
+
+shared_tier = create_shared_tier(SHARED_CACHE_URL)
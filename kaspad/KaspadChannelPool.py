@@ -0,0 +1,93 @@
+# encoding: utf-8
+import asyncio
+import time
+
+from grpc import ChannelConnectivity
+
+from kaspad.KaspadStream import KaspadStream
+from kaspad.KaspadThread import create_channel
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_POOL_SIZE = 32
+
+# streams beyond `size` are closed again after being idle this long (seconds)
+IDLE_STREAM_TIMEOUT = 60
+
+UNHEALTHY_STATES = (
+    ChannelConnectivity.TRANSIENT_FAILURE,
+    ChannelConnectivity.SHUTDOWN,
+)
+
+
+class KaspadChannelPool(object):
+    """
+    Keeps long-lived gRPC channels to one kaspad, each carrying one multiplexed
+    KaspadStream. kaspad handles the messages of a stream one after another, so a
+    request goes to the stream with the fewest requests in flight. If every stream
+    is busy, another one is opened, up to max_size. Streams beyond `size` are
+    closed again once idle for IDLE_STREAM_TIMEOUT. Channels which went into
+    TRANSIENT_FAILURE / SHUTDOWN are replaced on their next use.
+    """
+
+    def __init__(
+        self,
+        kaspad_host,
+        kaspad_port,
+        size=DEFAULT_POOL_SIZE,
+        max_size=DEFAULT_MAX_POOL_SIZE,
+    ):
+        self.kaspad_host = kaspad_host
+        self.kaspad_port = kaspad_port
+        self.size = max(1, int(size))
+        self.max_size = max(self.size, int(max_size))
+
+        self.__streams = []
+        self.__closing = set()
+
+    def get(self) -> KaspadStream:
+        self.__replace_unhealthy()
+        self.__close_idle()
+
+        stream = min(self.__streams, key=lambda s: s.in_flight, default=None)
+
+        if stream is None or (
+            stream.in_flight > 0 and len(self.__streams) < self.max_size
+        ):
+            stream = self.__open()
+            self.__streams.append(stream)
+
+        return stream
+
+    async def close(self):
+        streams, self.__streams = self.__streams, []
+
+        await asyncio.gather(
+            *(s.close() for s in streams), *self.__closing, return_exceptions=True
+        )
+
+    def __open(self):
+        return KaspadStream(create_channel(self.kaspad_host, self.kaspad_port))
+
+    def __replace_unhealthy(self):
+        for i, stream in enumerate(self.__streams):
+            if stream.channel.get_state() in UNHEALTHY_STATES:
+                self.__close_later(stream)
+                self.__streams[i] = self.__open()
+
+    def __close_idle(self):
+        now = time.monotonic()
+        extra = self.__streams[self.size :]
+        idle = [
+            s
+            for s in extra
+            if s.in_flight == 0 and now - s.last_used > IDLE_STREAM_TIMEOUT
+        ]
+
+        for stream in idle:
+            self.__streams.remove(stream)
+            self.__close_later(stream)
+
+    def __close_later(self, stream):
+        task = asyncio.create_task(stream.close())
+        self.__closing.add(task)
+        task.add_done_callback(self.__closing.discard)
@@ -0,0 +1,133 @@
+# encoding: utf-8
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+WINDOW_SIZE = 50  # last request outcomes looked at
+MIN_REQUESTS = 10  # no decision on fewer outcomes than this
+ERROR_RATE_THRESHOLD = 0.5
+OPEN_DURATION = 15  # seconds before a trial request is let through
+
+
+class KaspadCircuitBreaker(object):
+    """
+    Circuit breaker for one kaspad.
+
+    closed:    requests pass, outcomes are recorded. Opens when the error rate of
+               the last WINDOW_SIZE requests reaches ERROR_RATE_THRESHOLD.
+    open:      requests fail fast. After OPEN_DURATION it goes half-open.
+    half-open: a single trial request passes. Success closes the breaker, failure
+               opens it again.
+    """
+
+    def __init__(
+        self,
+        window_size=WINDOW_SIZE,
+        min_requests=MIN_REQUESTS,
+        error_rate_threshold=ERROR_RATE_THRESHOLD,
+        open_duration=OPEN_DURATION,
+    ):
+        self.min_requests = min_requests
+        self.error_rate_threshold = error_rate_threshold
+        self.open_duration = open_duration
+
+        self.__state = CLOSED
+        self.__outcomes = deque(maxlen=window_size)  # True = failure
+        self.__opened_at = 0
+        self.__trial_running = False
+
+    @property
+    def state(self):
+        if self.__state == OPEN and self.__open_elapsed():
+            return HALF_OPEN
+
+        return self.__state
+
+    @property
+    def error_rate(self):
+        if not self.__outcomes:
+            return 0.0
+
+        return sum(self.__outcomes) / len(self.__outcomes)
+
+    def is_available(self):
+        """
+        Whether a request could be sent now, without claiming the half-open trial
+        """
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and not self.__trial_running)
+
+    def allow_request(self):
+        state = self.state
+
+        if state == CLOSED:
+            return True
+
+        if state == HALF_OPEN and not self.__trial_running:
+            self.__state = HALF_OPEN
+            self.__trial_running = True
+            return True
+
+        return False
+
+    def record_success(self):
+        if self.__state == HALF_OPEN:
+            self.__close()
+        else:
+            self.__outcomes.append(False)
+
+    def record_failure(self):
+        if self.__state == HALF_OPEN:
+            self.__open()
+            return
+
+        self.__outcomes.append(True)
+
+        if (
+            self.__state == CLOSED
+            and len(self.__outcomes) >= self.min_requests
+            and self.error_rate >= self.error_rate_threshold
+        ):
+            self.__open()
+
+    def record_probe(self, success):
+        """
+        Outcome of a health probe, which is sent whatever the state. A successful
+        probe lets an open breaker send its trial request right away. A failed one
+        counts as a failure and restarts the open duration.
+        """
+        if not success:
+            if self.__state == OPEN:
+                self.__open()
+            else:
+                self.record_failure()
+
+        elif self.__state == OPEN:
+            self.__opened_at = time.monotonic() - self.open_duration
+
+        elif self.__state == CLOSED:
+            self.record_success()
+
+    def record_ignored(self):
+        """
+        For requests which ended without saying anything about the node, e.g. when
+        they were cancelled. A half-open trial is given up so another can start.
+        """
+        if self.__state == HALF_OPEN:
+            self.__trial_running = False
+
+    def __open_elapsed(self):
+        return time.monotonic() - self.__opened_at >= self.open_duration
+
+    def __open(self):
+        self.__state = OPEN
+        self.__opened_at = time.monotonic()
+        self.__trial_running = False
+
+    def __close(self):
+        self.__state = CLOSED
+        self.__outcomes.clear()
+        self.__trial_running = False
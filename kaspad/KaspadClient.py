@@ -1,36 +1,102 @@
 # encoding: utf-8
+import time
 
-from kaspad.KaspadThread import KaspadThread
+from google.protobuf import json_format
+
+from kaspad.KaspadChannelPool import (
+    DEFAULT_MAX_POOL_SIZE,
+    DEFAULT_POOL_SIZE,
+    KaspadChannelPool,
+)
+from kaspad.KaspadCircuitBreaker import KaspadCircuitBreaker
+from kaspad.KaspadThread import KaspadThread, KaspadCommunicationError
 
 
 # pipenv run python -m grpc_tools.protoc -I./protos --python_out=. --grpc_python_out=. ./protos/rpc.proto ./protos/messages.proto ./protos/p2p.proto
 
+# weight of the newest latency sample in the moving average
+LATENCY_EWMA_ALPHA = 0.2
+
 
 class KaspadClient(object):
-    def __init__(self, kaspad_host, kaspad_port):
+    def __init__(
+        self,
+        kaspad_host,
+        kaspad_port,
+        pool_size=DEFAULT_POOL_SIZE,
+        max_pool_size=DEFAULT_MAX_POOL_SIZE,
+    ):
         self.kaspad_host = kaspad_host
         self.kaspad_port = kaspad_port
+        self.channel_pool = KaspadChannelPool(
+            kaspad_host, kaspad_port, pool_size, max_pool_size
+        )
+        self.circuit_breaker = KaspadCircuitBreaker()
         self.server_version = None
         self.is_utxo_indexed = None
         self.is_synced = None
         self.p2p_id = None
+        self.state = None  # maintained by KaspadHealthProber
+
+        # load statistics used by KaspadMultiClient to balance requests
+        self.in_flight = 0
+        self.latency = 0.0  # EWMA of successful request latency in seconds
 
     async def ping(self):
+        # sent past the circuit breaker, so an open breaker is not taken for a node
+        # being down. The breaker gets the outcome instead.
         try:
-            info = await self.request("getInfoRequest")
-            self.server_version = info["getInfoResponse"]["serverVersion"]
-            self.is_utxo_indexed = info["getInfoResponse"]["isUtxoIndexed"]
-            self.is_synced = info["getInfoResponse"]["isSynced"]
-            self.p2p_id = info["getInfoResponse"]["p2pId"]
-            return info
-
+            resp = await self.channel_pool.get().request("getInfoRequest", timeout=5)
         except Exception as exc:
+            self.circuit_breaker.record_probe(False)
             return False
 
-    async def request(self, command, params=None, timeout=5):
-        async with KaspadThread(self.kaspad_host, self.kaspad_port) as t:
-            return await t.request(command, params, timeout=timeout)
+        self.circuit_breaker.record_probe(True)
+
+        info = resp.getInfoResponse
+        self.server_version = info.serverVersion
+        self.is_utxo_indexed = info.isUtxoIndexed
+        self.is_synced = info.isSynced
+        self.p2p_id = info.p2pId
+        return info
+
+    async def request(self, command, params=None, timeout=5, raw=False):
+        """
+        raw=True returns the KaspadMessage itself instead of a dict
+        """
+        if not self.circuit_breaker.allow_request():
+            raise KaspadCommunicationError(
+                f"Circuit breaker for {self.kaspad_host}:{self.kaspad_port} is open"
+            )
 
-    async def notify(self, command, params, callback):
+        stream = self.channel_pool.get()
+        start = time.monotonic()
+        self.in_flight += 1
+
+        try:
+            resp = await stream.request(command, params, timeout=timeout)
+        except KaspadCommunicationError:
+            self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self.circuit_breaker.record_ignored()
+            raise
+        finally:
+            self.in_flight -= 1
+
+        self.circuit_breaker.record_success()
+        self.__add_latency_sample(time.monotonic() - start)
+        return resp if raw else json_format.MessageToDict(resp)
+
+    def __add_latency_sample(self, seconds):
+        if self.latency == 0:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_EWMA_ALPHA * (seconds - self.latency)
+
+    async def subscribe(self, commands, callback):
         async with KaspadThread(self.kaspad_host, self.kaspad_port) as t:
-            return await t.notify(command, params, callback)
+            return await t.subscribe(commands, callback)
+
+    async def close(self):
+        await self.channel_pool.close()
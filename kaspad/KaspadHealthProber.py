@@ -0,0 +1,85 @@
+# encoding: utf-8
+import asyncio
+import random
+
+from kaspad.KaspadClient import KaspadClient
+
+HEALTHY = "healthy"  # synced and utxo-indexed, answering pings
+DEGRADED = "degraded"  # answering, but failed recently or has no utxo index
+DOWN = "down"  # several pings in a row failed
+SYNCING = "syncing"  # answering, but not synced yet
+
+PROBE_INTERVAL = 10  # seconds between pings of a healthy node
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+FAILURES_UNTIL_DOWN = 3
+
+
+class KaspadHealthProber(object):
+    """
+    Pings one kaspad in the background and keeps its state in `kaspad.state`, so the
+    request path can read a cached view instead of pinging. Failing nodes are probed
+    with exponential backoff plus jitter.
+    """
+
+    def __init__(self, kaspad: KaspadClient, interval=PROBE_INTERVAL):
+        self.kaspad = kaspad
+        self.interval = interval
+        self.failures = 0
+
+        self.__task = None
+        self.__wakeup = asyncio.Event()
+
+    def start(self):
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self):
+        if self.__task is not None:
+            self.__task.cancel()
+            await asyncio.gather(self.__task, return_exceptions=True)
+            self.__task = None
+
+    async def probe(self):
+        if await self.kaspad.ping():
+            self.failures = 0
+
+            if not self.kaspad.is_synced:
+                self.kaspad.state = SYNCING
+            elif not self.kaspad.is_utxo_indexed:
+                self.kaspad.state = DEGRADED
+            else:
+                self.kaspad.state = HEALTHY
+        else:
+            self.failures += 1
+            self.kaspad.state = (
+                DOWN if self.failures >= FAILURES_UNTIL_DOWN else DEGRADED
+            )
+
+        return self.kaspad.state
+
+    def report_failure(self):
+        """
+        Called by the request path on a communication error. Only a healthy node
+        gets an early probe, nodes which are failing already stay in their backoff.
+        """
+        if self.kaspad.state == HEALTHY:
+            self.kaspad.state = DEGRADED
+            self.__wakeup.set()
+
+    def next_delay(self):
+        if self.failures == 0:
+            return self.interval * random.uniform(0.9, 1.1)
+
+        backoff = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failures - 1))
+        return random.uniform(backoff / 2, backoff)
+
+    async def __run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.__wakeup.wait(), self.next_delay())
+            except asyncio.TimeoutError:
+                pass
+
+            self.__wakeup.clear()
+            await self.probe()
@@ -1,36 +1,235 @@
 # encoding: utf-8
 import asyncio
+import json
+import time
+from collections import deque
 
+from google.protobuf import json_format
+
+from kaspad.KaspadChannelPool import DEFAULT_MAX_POOL_SIZE, DEFAULT_POOL_SIZE
 from kaspad.KaspadClient import KaspadClient
+from kaspad.KaspadHealthProber import KaspadHealthProber, HEALTHY, DEGRADED
 
 # pipenv run python -m grpc_tools.protoc -I./protos --python_out=. --grpc_python_out=. ./protos/rpc.proto ./protos/messages.proto ./protos/p2p.proto
 from kaspad.KaspadThread import KaspadCommunicationError
 
+ROUND_ROBIN = "round-robin"
+LEAST_OUTSTANDING = "least-outstanding"
+EWMA_LATENCY = "ewma"
+
+BALANCING_POLICIES = (ROUND_ROBIN, LEAST_OUTSTANDING, EWMA_LATENCY)
+
+# hedged requests go to a second node once the first one is slower than this
+# percentile of the command's recent latencies
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_DEFAULT_DELAY = 0.5  # seconds, used until enough samples are collected
+LATENCY_WINDOW = 500
+
+
+def is_read_only(command):
+    return command.startswith("get")
+
+
+def coalescing_key(command, params):
+    if isinstance(params, dict):
+        params = json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+    return command, params or ""
+
 
 class KaspadMultiClient(object):
-    def __init__(self, hosts: list[str]):
-        self.kaspads = [KaspadClient(*h.split(":")) for h in hosts]
+    def __init__(
+        self,
+        hosts: list[str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_pool_size: int = DEFAULT_MAX_POOL_SIZE,
+        policy: str = EWMA_LATENCY,
+    ):
+        if policy not in BALANCING_POLICIES:
+            raise ValueError(
+                f"Unknown balancing policy {policy!r}, use one of {BALANCING_POLICIES}"
+            )
+
+        self.kaspads = [
+            KaspadClient(*h.split(":"), pool_size, max_pool_size) for h in hosts
+        ]
+        self.probers = {k: KaspadHealthProber(k) for k in self.kaspads}
+        self.policy = policy
+        self.__next = 0
+        self.__latencies = {}  # command -> recent latencies in seconds
+        self.__coalesced = {}  # (command, canonical params) -> running request task
+
+    def __get_kaspad(self, exclude=()):
+        # nodes with an open circuit breaker are skipped right away
+        usable = [
+            k
+            for k in self.kaspads
+            if k not in exclude and k.circuit_breaker.is_available()
+        ]
+        candidates = [k for k in usable if k.state == HEALTHY] or [
+            k for k in usable if k.state == DEGRADED
+        ]
+
+        if not candidates:
+            return None
+
+        if self.policy == ROUND_ROBIN:
+            self.__next = (self.__next + 1) % len(candidates)
+            return candidates[self.__next]
 
-    def __get_kaspad(self):
-        for k in self.kaspads:
-            if k.is_utxo_indexed and k.is_synced:
-                return k
+        if self.policy == LEAST_OUTSTANDING:
+            return min(candidates, key=lambda k: k.in_flight)
+
+        # EWMA latency, scaled by the queue a request would wait behind. Nodes
+        # without samples count with the average of the others, a latency of 0
+        # would send them all requests until their first one is answered.
+        sampled = [k.latency for k in candidates if k.latency]
+        seed = sum(sampled) / len(sampled) if sampled else 1.0
+
+        return min(candidates, key=lambda k: (k.latency or seed) * (k.in_flight + 1))
 
     async def initialize_all(self):
-        tasks = [asyncio.create_task(k.ping()) for k in self.kaspads]
+        """
+        Probes all kaspads once. Afterwards start_probing() keeps the states current.
+        """
+        await asyncio.gather(*(p.probe() for p in self.probers.values()))
+
+    def start_probing(self):
+        for p in self.probers.values():
+            p.start()
+
+    async def request(self, command, params=None, timeout=5, hedge=False, raw=False):
+        """
+        Identical read-only requests running at the same time share one kaspad
+        request (the first caller's timeout and hedge setting apply).
+
+        hedge=True sends a read-only command to a second node as well if the first
+        one has not answered within the command's latency percentile
+
+        raw=True returns the KaspadMessage instead of a dict, so callers can read
+        the fields they need without the MessageToDict conversion. It may be shared
+        with other callers and must not be modified.
+        """
+        if not is_read_only(command):
+            resp = await self.__request(command, params, timeout, hedge)
+        else:
+            key = coalescing_key(command, params)
+            task = self.__coalesced.get(key)
+
+            if task is None:
+                task = asyncio.create_task(
+                    self.__request(command, params, timeout, hedge)
+                )
+                task.add_done_callback(lambda t: self.__forget_coalesced(key, t))
+                self.__coalesced[key] = task
+
+            # a cancelled caller must not cancel the request for the others
+            resp = await asyncio.shield(task)
+
+        return resp if raw else json_format.MessageToDict(resp)
+
+    def __forget_coalesced(self, key, task):
+        if self.__coalesced.get(key) is task:
+            del self.__coalesced[key]
+
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every caller went away
+
+    async def __request(self, command, params, timeout, hedge):
+        if hedge and is_read_only(command) and len(self.kaspads) > 1:
+            return await self.__hedged_request(command, params, timeout)
 
-        for t in tasks:
-            await t
+        kaspad = self.__get_kaspad()
 
-    async def request(self, command, params=None, timeout=5):
         try:
-            return await self.__get_kaspad().request(command, params, timeout=timeout)
+            return await self.__timed_request(kaspad, command, params, timeout)
         except KaspadCommunicationError:
-            await self.initialize_all()
-            return await self.__get_kaspad().request(command, params, timeout=timeout)
+            # retry once, preferably on another node. The prober takes care of
+            # the failed one, it is only used again if it still looks usable.
+            retry_kaspad = self.__get_kaspad(exclude=(kaspad,)) or self.__get_kaspad()
 
-    async def notify(self, command, params, callback):
-        return await self.__get_kaspad().notify(command, params, callback)
+            if retry_kaspad is None:
+                raise
+
+            return await self.__timed_request(retry_kaspad, command, params, timeout)
+
+    async def __timed_request(self, kaspad, command, params, timeout):
+        if kaspad is None:
+            raise KaspadCommunicationError("No healthy kaspad available")
+
+        start = time.monotonic()
+
+        try:
+            resp = await kaspad.request(command, params, timeout=timeout, raw=True)
+        except KaspadCommunicationError:
+            self.probers[kaspad].report_failure()
+            raise
+
+        self.__latencies.setdefault(command, deque(maxlen=LATENCY_WINDOW)).append(
+            time.monotonic() - start
+        )
+        return resp
+
+    def __hedge_delay(self, command):
+        samples = self.__latencies.get(command, ())
+
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+
+        return sorted(samples)[int(HEDGE_PERCENTILE * (len(samples) - 1))]
+
+    async def __hedged_request(self, command, params, timeout):
+        primary = self.__get_kaspad()
+        tasks = {
+            asyncio.create_task(self.__timed_request(primary, command, params, timeout))
+        }
+        hedged = False
+        error = None
+
+        try:
+            while True:
+                done, tasks = await asyncio.wait(
+                    tasks,
+                    timeout=None if hedged else self.__hedge_delay(command),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for t in done:
+                    if t.exception() is None:
+                        return t.result()
+
+                    error = t.exception()
+
+                if not hedged:
+                    # primary is slow or failed, ask another node as well
+                    hedged = True
+                    secondary = self.__get_kaspad(exclude=(primary,))
+
+                    if secondary is not None:
+                        hedge_request = self.__timed_request(
+                            secondary, command, params, timeout
+                        )
+                        tasks.add(asyncio.create_task(hedge_request))
+
+                if not tasks:
+                    raise error
+        finally:
+            # the loser (or everything, if the caller was cancelled) is not needed
+            for t in tasks:
+                t.cancel()
+
+    async def subscribe(self, commands, callback):
+        kaspad = self.__get_kaspad()
+
+        if kaspad is None:
+            raise KaspadCommunicationError("No healthy kaspad available")
+
+        return await kaspad.subscribe(commands, callback)
+
+    async def close(self):
+        await asyncio.gather(*(p.stop() for p in self.probers.values()))
+        await asyncio.gather(*(k.close() for k in self.kaspads))
 
 
 if __name__ == "__main__":
@@ -51,7 +250,5 @@ if __name__ == "__main__":
 
     print(d)
 
-    import json
-
     with open(r"C:\temp\chain.txt", "w") as f:
         json.dump(d, f)
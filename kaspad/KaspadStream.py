@@ -0,0 +1,161 @@
+# encoding: utf-8
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+
+import grpc
+
+from . import messages_pb2_grpc
+from .KaspadThread import KaspadCommunicationError, build_message
+from .messages_pb2 import KaspadMessage
+
+
+def response_matches(command, params, resp: KaspadMessage):
+    """
+    Checks the identifying fields of a response against its request, for nodes
+    which do not echo request ids
+    """
+    if command == "getBlockRequest" and isinstance(params, dict):
+        block = resp.getBlockResponse
+        block_hash = block.block.verboseData.hash
+
+        return (
+            block.HasField("error")
+            or not block_hash
+            or block_hash == params.get("hash")
+        )
+
+    return True
+
+
+class KaspadStream(object):
+    """
+    One long-running bidirectional MessageStream which carries many requests at once.
+
+    Every request carries an id in KaspadMessage.id and waits in one FIFO of the
+    stream. Nodes which echo the id get their response matched by it. Others send
+    0; they handle the messages of a stream one after another, so any response
+    which is not a notification belongs to the oldest waiting request, whatever
+    its type (kaspad answers some bad requests with another response type).
+
+    Without ids, waiters which timed out stay in the FIFO, so the late response is
+    consumed by them and does not shift the other answers. A dropped or reordered
+    response would, which response_matches detects where the response identifies
+    its request.
+    """
+
+    def __init__(self, channel: grpc.aio.Channel):
+        self.channel = channel
+        self.stub = messages_pb2_grpc.RPCStub(channel)
+
+        self.__call = None
+        self.__reader = None
+        self.__outgoing = None
+        self.__pending = OrderedDict()  # request id -> future, in sending order
+        self.__request_ids = itertools.count(1)
+        self.__echoes_ids = False
+
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+
+    async def request(self, command, params=None, timeout=120) -> KaspadMessage:
+        if self.__call is None:
+            self.__open()
+
+        request_id = next(self.__request_ids)
+        fut = asyncio.get_running_loop().create_future()
+
+        msg = build_message(command, params)
+        msg.id = request_id
+
+        self.__pending[request_id] = fut
+        self.__outgoing.put_nowait(msg)
+        self.in_flight += 1
+
+        try:
+            resp = await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            raise KaspadCommunicationError(
+                f"{command} #{request_id} timed out after {timeout}s"
+            )
+        finally:
+            self.in_flight -= 1
+            self.last_used = time.monotonic()
+
+            # a late response finds its request by id, the waiter is not needed
+            if self.__echoes_ids:
+                self.__pending.pop(request_id, None)
+
+        if resp.id == 0 and not response_matches(command, params, resp):
+            # the responses of this stream are shifted, none of them can be trusted
+            error = KaspadCommunicationError(
+                f"Responses out of order, {command} #{request_id} got the response "
+                f"of another request"
+            )
+            self.__reset(error)
+            raise error
+
+        return resp
+
+    async def close(self):
+        self.__reset(KaspadCommunicationError("Stream closed"))
+        await self.channel.close()
+
+    def __open(self):
+        self.__outgoing = asyncio.Queue()
+        self.__call = self.stub.MessageStream(self.__yield_messages(self.__outgoing))
+        self.__reader = asyncio.create_task(self.__read(self.__call))
+
+    async def __yield_messages(self, outgoing):
+        while True:
+            msg = await outgoing.get()
+
+            if msg is None:
+                return
+
+            yield msg
+
+    async def __read(self, call):
+        try:
+            async for resp in call:
+                if (resp.WhichOneof("payload") or "").endswith("Notification"):
+                    # nobody asked for it on this stream
+                    continue
+
+                if resp.id:
+                    self.__echoes_ids = True
+                    fut = self.__pending.pop(resp.id, None)
+                elif self.__pending:
+                    _, fut = self.__pending.popitem(last=False)
+                else:
+                    continue
+
+                if fut is not None and not fut.done():
+                    fut.set_result(resp)
+
+            error = KaspadCommunicationError("Stream ended by kaspad")
+
+        except grpc.aio.AioRpcError as e:
+            error = KaspadCommunicationError(str(e))
+
+        if self.__call is call:
+            self.__reset(error)
+
+    def __reset(self, error):
+        """
+        Fails every waiting request and lets the next request open a new stream
+        """
+        if self.__call is not None:
+            self.__outgoing.put_nowait(None)
+            self.__call.cancel()
+
+        if self.__reader is not None and self.__reader is not asyncio.current_task():
+            self.__reader.cancel()
+
+        pending, self.__pending = self.__pending, OrderedDict()
+        self.__call = self.__reader = self.__outgoing = None
+
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
@@ -17,6 +17,32 @@ class KaspadCommunicationError(Exception):
     pass
 
 
+def create_channel(kaspad_host, kaspad_port):
+    return grpc.aio.insecure_channel(
+        f"{kaspad_host}:{kaspad_port}",
+        compression=grpc.Compression.Gzip,
+        options=[
+            ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+        ],
+    )
+
+
+def build_message(cmd, params=None):
+    msg = KaspadMessage()
+    msg2 = getattr(msg, cmd)
+    payload = params
+
+    if payload:
+        if isinstance(payload, dict):
+            json_format.ParseDict(payload, msg2)
+        if isinstance(payload, str):
+            json_format.Parse(payload, msg2)
+
+    msg2.SetInParent()
+    return msg
+
+
 # pipenv run python -m grpc_tools.protoc -I./protos --python_out=. --grpc_python_out=. ./protos/rpc.proto ./protos/messages.proto ./protos/p2p.proto
 
 
@@ -26,14 +52,7 @@ class KaspadThread(object):
         self.kaspad_host = kaspad_host
         self.kaspad_port = kaspad_port
 
-        self.channel = grpc.aio.insecure_channel(
-            f"{kaspad_host}:{kaspad_port}",
-            compression=grpc.Compression.Gzip,
-            options=[
-                ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
-                ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
-            ],
-        )
+        self.channel = create_channel(kaspad_host, kaspad_port)
 
         self.stub = messages_pb2_grpc.RPCStub(self.channel)
         self.__queue = asyncio.queues.Queue()
@@ -44,36 +63,23 @@ class KaspadThread(object):
     async def __aexit__(self, *args):
         await self.channel.close()
 
-    async def request(self, command, params=None, timeout=120):
+    async def subscribe(self, commands, callback_func=None):
+        """
+        Sends several notify*Request commands on one stream and passes everything
+        kaspad sends back to callback_func
+        """
         try:
-            async for resp in self.stub.MessageStream(
-                self.yield_cmd(command, params), timeout=timeout
-            ):
-                self.__queue.put_nowait("done")
-                return json_format.MessageToDict(resp)
-        except grpc.aio._call.AioRpcError as e:
-            raise KaspadCommunicationError(str(e))
-
-    async def notify(self, command, params=None, callback_func=None):
-        try:
-            async for resp in self.stub.MessageStream(self.yield_cmd(command, params)):
+            async for resp in self.stub.MessageStream(self.yield_cmds(commands)):
                 if callback_func:
                     await callback_func(json_format.MessageToDict(resp))
 
         except (grpc.aio._call.AioRpcError, _MultiThreadedRendezvous) as e:
             raise KaspadCommunicationError(str(e))
 
-    async def yield_cmd(self, cmd, params=None):
-        msg = KaspadMessage()
-        msg2 = getattr(msg, cmd)
-        payload = params
-
-        if payload:
-            if isinstance(payload, dict):
-                json_format.ParseDict(payload, msg2)
-            if isinstance(payload, str):
-                json_format.Parse(payload, msg2)
+    async def yield_cmds(self, cmds):
+        # a command is its name or a (name, params) tuple
+        for cmd in cmds:
+            cmd, params = cmd if isinstance(cmd, tuple) else (cmd, None)
+            yield build_message(cmd, params)
 
-        msg2.SetInParent()
-        yield msg
         await self.__queue.get()
@@ -7,6 +7,9 @@ from helper.import_endpoints import *
 from fastapi_utils.tasks import repeat_every
 from starlette.responses import RedirectResponse
 
+from dbsession import close_pg_pool
+from helper import notifications
+from helper.Event import throttled
 from server import app, kaspad_client, memory_cache
 from sockets import blocks
 
@@ -16,11 +19,17 @@ BLOCKS_TASK = None  # type: Task
 @app.on_event("startup")
 async def startup():
     global BLOCKS_TASK
-    # find kaspad before staring webserver
+    # find kaspad before staring webserver, then keep watching them in background
     await kaspad_client.initialize_all()
+    kaspad_client.start_probing()
     BLOCKS_TASK = asyncio.create_task(blocks.config())
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await close_pg_pool()
+
+
 @app.on_event("startup")
 @repeat_every(seconds=5)
 async def watchdog():
@@ -33,18 +42,26 @@ async def watchdog():
     else:
         print(
             f"Watch found an error! {exception}\n"
-            f"Reinitialize kaspads and start task again"
+            f"Start task again"
         )
-        await kaspad_client.initialize_all()
         BLOCKS_TASK = asyncio.create_task(blocks.config())
 
 
-@app.on_event("startup")
-@repeat_every(seconds=5)
-async def refresh_dashboard_metrics():
+@throttled(5)
+async def refresh_dashboard_metrics(*args):
     memory_cache['dashboard_metrics_cache'] = await get_dashboard_metrics(use_cache=False)
 
 
+notifications.virtual_daa_score_changed += refresh_dashboard_metrics
+
+
+# fallback while the notification stream is down
+@app.on_event("startup")
+@repeat_every(seconds=60)
+async def periodical_dashboard_metrics():
+    await refresh_dashboard_metrics()
+
+
 @app.get("/", include_in_schema=False)
 async def docs_redirect():
     return RedirectResponse(url="/docs")
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, BigInteger, Boolean
+
+from dbsession import Base
+
+
+class AddressTxCount(Base):
+    """
+    Number of rows per address in tx_id_address_mapping, maintained by the trigger
+    in scripts/counters/address_tx_counts.sql
+    """
+
+    __tablename__ = "address_tx_counts"
+    address = Column(String, primary_key=True)
+    tx_count = Column(BigInteger)
+    is_estimated = Column(Boolean, default=True)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String
+
+from dbsession import Base
+
+
+class BlockParent(Base):
+    """
+    parent -> child edges of blocks.parents, maintained by the trigger in
+    scripts/mappings/block_parents.sql
+    """
+
+    __tablename__ = "block_parents"
+    parent_hash = Column(String, primary_key=True)
+    child_hash = Column(String, primary_key=True)
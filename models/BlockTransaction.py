@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String
+
+from dbsession import Base
+
+
+class BlockTransaction(Base):
+    """
+    block -> transaction edges of transactions.block_hash, maintained by the trigger
+    in scripts/mappings/block_transactions.sql
+    """
+
+    __tablename__ = "block_transactions"
+    block_hash = Column(String, primary_key=True)
+    transaction_id = Column(String, primary_key=True)
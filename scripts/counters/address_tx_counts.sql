@@ -0,0 +1,100 @@
+-- address -> number of rows in tx_id_address_mapping, so /addresses/{kaspaAddress}/transactions
+-- does not need a count(*) over all transactions of an address per request.
+--
+-- is_estimated is TRUE while a row only holds what the trigger counted since it was
+-- installed. The reconcile job below recounts those rows and clears the flag.
+CREATE TABLE IF NOT EXISTS address_tx_counts (
+  address VARCHAR PRIMARY KEY,
+  tx_count BIGINT NOT NULL DEFAULT 0,
+  is_estimated BOOLEAN NOT NULL DEFAULT TRUE
+);
+
+CREATE INDEX IF NOT EXISTS address_tx_counts_estimated
+  ON address_tx_counts (address) WHERE is_estimated;
+
+-- one row while the backfill below has not finished. Only counters the trigger
+-- creates meanwhile can miss history, later ones start at an address' first row.
+CREATE TABLE IF NOT EXISTS address_tx_counts_backfill (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id)  -- single row
+);
+
+INSERT INTO address_tx_counts_backfill DEFAULT VALUES ON CONFLICT DO NOTHING;
+
+-- 1. maintain the counters on every insert / delete, once per statement
+CREATE OR REPLACE FUNCTION address_tx_counts_insert() RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO address_tx_counts (address, tx_count, is_estimated)
+  SELECT address, count(*), EXISTS (SELECT FROM address_tx_counts_backfill)
+  FROM new_rows
+  GROUP BY address
+  ORDER BY address
+  ON CONFLICT (address) DO UPDATE
+    SET tx_count = address_tx_counts.tx_count + EXCLUDED.tx_count;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION address_tx_counts_delete() RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE address_tx_counts c
+  SET tx_count = GREATEST(c.tx_count - d.tx_count, 0)
+  FROM (
+    SELECT address, count(*) AS tx_count FROM old_rows GROUP BY address
+  ) d
+  WHERE c.address = d.address;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS address_tx_counts_insert ON tx_id_address_mapping;
+CREATE TRIGGER address_tx_counts_insert
+  AFTER INSERT ON tx_id_address_mapping
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION address_tx_counts_insert();
+
+DROP TRIGGER IF EXISTS address_tx_counts_delete ON tx_id_address_mapping;
+CREATE TRIGGER address_tx_counts_delete
+  AFTER DELETE ON tx_id_address_mapping
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION address_tx_counts_delete();
+
+-- 2. one-off backfill of the history. Addresses the trigger has seen meanwhile are
+--    left alone, they stay estimated until the reconcile job recounts them.
+INSERT INTO address_tx_counts (address, tx_count, is_estimated)
+SELECT address, count(*), FALSE
+FROM tx_id_address_mapping
+GROUP BY address
+ON CONFLICT (address) DO NOTHING;
+
+DELETE FROM address_tx_counts_backfill;
+
+-- 3. recount estimated rows in small batches. The rows are locked first, so
+--    increments committing meanwhile wait for the recount instead of being
+--    overwritten by it, and the recount (a new snapshot) sees every increment
+--    committed before.
+CREATE OR REPLACE FUNCTION address_tx_counts_reconcile(batch_size INT) RETURNS VOID AS $$
+DECLARE
+  addresses VARCHAR[];
+BEGIN
+  SELECT array_agg(address) INTO addresses
+  FROM (
+    SELECT address
+    FROM address_tx_counts
+    WHERE is_estimated
+    ORDER BY address
+    LIMIT batch_size
+    FOR UPDATE
+  ) locked;
+
+  UPDATE address_tx_counts c
+  SET tx_count = (SELECT count(*) FROM tx_id_address_mapping m WHERE m.address = c.address),
+      is_estimated = FALSE
+  WHERE c.address = ANY(addresses);
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT 
+  cron.schedule(
+    '* * * * *', 
+    $$SELECT address_tx_counts_reconcile(1000)$$
+);
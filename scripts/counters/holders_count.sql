@@ -0,0 +1,80 @@
+-- Number of addresses with a non-zero balance, so /holders/overview and
+-- /dashboard/metrics do not count(*) over address_balances.
+--
+-- Writers only append to holders_count_deltas (no hot row to lock), the cron job
+-- below folds the deltas into holders_count. Readers add the pending deltas:
+--   SELECT holders + (SELECT COALESCE(SUM(delta), 0) FROM holders_count_deltas)
+--   FROM holders_count
+CREATE TABLE IF NOT EXISTS holders_count (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),  -- single row
+  holders BIGINT NOT NULL,
+  updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS holders_count_deltas (
+  id BIGSERIAL PRIMARY KEY,
+  delta BIGINT NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION holders_count_track() RETURNS TRIGGER AS $$
+DECLARE
+  delta BIGINT := 0;
+BEGIN
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    delta := delta + (SELECT COUNT(*) FROM new_rows WHERE balance > 0);
+  END IF;
+
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    delta := delta - (SELECT COUNT(*) FROM old_rows WHERE balance > 0);
+  END IF;
+
+  IF delta <> 0 THEN
+    INSERT INTO holders_count_deltas (delta) VALUES (delta);
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- triggers and the initial count in one transaction: creating the triggers locks
+-- out writers until the count is committed, so no change is missed or counted twice
+BEGIN;
+
+DROP TRIGGER IF EXISTS holders_count_insert ON address_balances;
+CREATE TRIGGER holders_count_insert
+  AFTER INSERT ON address_balances
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION holders_count_track();
+
+DROP TRIGGER IF EXISTS holders_count_update ON address_balances;
+CREATE TRIGGER holders_count_update
+  AFTER UPDATE ON address_balances
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION holders_count_track();
+
+DROP TRIGGER IF EXISTS holders_count_delete ON address_balances;
+CREATE TRIGGER holders_count_delete
+  AFTER DELETE ON address_balances
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION holders_count_track();
+
+TRUNCATE holders_count_deltas;
+
+INSERT INTO holders_count (holders)
+SELECT COUNT(*) FROM address_balances WHERE balance > 0
+ON CONFLICT (id) DO UPDATE SET holders = EXCLUDED.holders, updated_at = NOW();
+
+COMMIT;
+
+SELECT 
+  cron.schedule(
+    '* * * * *', 
+    $$
+    WITH folded AS (
+      DELETE FROM holders_count_deltas RETURNING delta
+    )
+    UPDATE holders_count
+    SET holders = holders + (SELECT COALESCE(SUM(delta), 0) FROM folded),
+        updated_at = NOW()
+    $$
+);
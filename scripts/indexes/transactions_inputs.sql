@@ -0,0 +1,4 @@
+-- Spent status of transaction outputs (/transactions/{transactionId}) joins the
+-- outputs' (hash, index) pairs against this index.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transactions_inputs_previous_outpoint
+  ON transactions_inputs (previous_outpoint_hash, previous_outpoint_index);
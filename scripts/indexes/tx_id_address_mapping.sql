@@ -0,0 +1,4 @@
+-- Keyset pagination of /addresses/{kaspaAddress}/transactions (before / after cursors)
+-- walks this index from the cursor on instead of skipping OFFSET rows.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tx_id_address_mapping_address_block_time_id
+  ON tx_id_address_mapping (address, block_time DESC, id DESC);
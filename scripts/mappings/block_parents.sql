@@ -0,0 +1,47 @@
+-- parent_hash -> child_hash, so the children of a block are an index-only scan of
+-- the primary key instead of an overlap (&&) filter over blocks.parents.
+CREATE TABLE IF NOT EXISTS block_parents (
+  parent_hash VARCHAR NOT NULL,
+  child_hash VARCHAR NOT NULL,
+  PRIMARY KEY (parent_hash, child_hash)
+);
+
+-- one row while the backfill below has not finished. Until then the API falls back
+-- to scanning blocks.parents for blocks without children here.
+CREATE TABLE IF NOT EXISTS block_parents_backfill (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id)  -- single row
+);
+
+INSERT INTO block_parents_backfill DEFAULT VALUES ON CONFLICT DO NOTHING;
+
+-- 1. keep it in sync with blocks.parents
+CREATE OR REPLACE FUNCTION block_parents_sync() RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    DELETE FROM block_parents
+    WHERE child_hash = OLD.hash
+      AND (TG_OP = 'DELETE' OR NOT parent_hash = ANY(COALESCE(NEW.parents, '{}')));
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    INSERT INTO block_parents (parent_hash, child_hash)
+    SELECT DISTINCT UNNEST(NEW.parents), NEW.hash
+    ON CONFLICT DO NOTHING;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS block_parents_sync ON blocks;
+CREATE TRIGGER block_parents_sync
+  AFTER INSERT OR DELETE OR UPDATE OF parents ON blocks
+  FOR EACH ROW EXECUTE FUNCTION block_parents_sync();
+
+-- 2. one-off backfill of the existing blocks
+INSERT INTO block_parents (parent_hash, child_hash)
+SELECT DISTINCT UNNEST(parents), hash
+FROM blocks
+ON CONFLICT DO NOTHING;
+
+DELETE FROM block_parents_backfill;
@@ -0,0 +1,48 @@
+-- block_hash -> transaction_id, so the transactions of a block are an index lookup
+-- instead of a scan of transactions.block_hash (ARRAY) for the block.
+CREATE TABLE IF NOT EXISTS block_transactions (
+  block_hash VARCHAR NOT NULL,
+  transaction_id VARCHAR NOT NULL,
+  PRIMARY KEY (block_hash, transaction_id)
+);
+
+-- one row while the backfill below has not finished. Until then the API falls back
+-- to scanning transactions.block_hash for blocks without rows here.
+CREATE TABLE IF NOT EXISTS block_transactions_backfill (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id)  -- single row
+);
+
+INSERT INTO block_transactions_backfill DEFAULT VALUES ON CONFLICT DO NOTHING;
+
+-- 1. keep it in sync with transactions.block_hash. A transaction included by a
+--    further block gets that hash appended, hence the trigger on UPDATE as well.
+CREATE OR REPLACE FUNCTION block_transactions_sync() RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    DELETE FROM block_transactions
+    WHERE transaction_id = OLD.transaction_id
+      AND (TG_OP = 'DELETE' OR NOT block_hash = ANY(COALESCE(NEW.block_hash, '{}')));
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    INSERT INTO block_transactions (block_hash, transaction_id)
+    SELECT DISTINCT UNNEST(NEW.block_hash), NEW.transaction_id
+    ON CONFLICT DO NOTHING;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS block_transactions_sync ON transactions;
+CREATE TRIGGER block_transactions_sync
+  AFTER INSERT OR DELETE OR UPDATE OF block_hash ON transactions
+  FOR EACH ROW EXECUTE FUNCTION block_transactions_sync();
+
+-- 2. one-off backfill of the existing transactions
+INSERT INTO block_transactions (block_hash, transaction_id)
+SELECT DISTINCT UNNEST(block_hash), transaction_id
+FROM transactions
+ON CONFLICT DO NOTHING;
+
+DELETE FROM block_transactions_backfill;
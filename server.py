@@ -5,7 +5,6 @@ from dotenv import load_dotenv
 import socketio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_utils.tasks import repeat_every
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from fastapi.routing import APIRoute
@@ -67,20 +66,23 @@ for i in range(100):
 if not kaspad_hosts:
     raise Exception("Please set at least KASPAD_HOST_1 environment variable.")
 
-kaspad_client = KaspadMultiClient(kaspad_hosts)
+kaspad_client = KaspadMultiClient(
+    kaspad_hosts,
+    pool_size=int(os.getenv("KASPAD_CHANNEL_POOL_SIZE", 4)),
+    max_pool_size=int(os.getenv("KASPAD_CHANNEL_POOL_MAX_SIZE", 32)),
+    policy=os.getenv("KASPAD_BALANCING_POLICY", "ewma"),
+)
 memory_cache = {}
 
 
 @app.exception_handler(Exception)
 async def unicorn_exception_handler(request: Request, exc: Exception):
-    await kaspad_client.initialize_all()
     return JSONResponse(
         status_code=500,
         content={"message": "Internal server error"},
     )
 
 
-@app.on_event("startup")
-@repeat_every(seconds=60)
-async def periodical_blockdag():
-    await kaspad_client.initialize_all()
+@app.on_event("shutdown")
+async def close_kaspad_channels():
+    await kaspad_client.close()
@@ -1,20 +1,32 @@
 # encoding: utf-8
 import threading
 
-from fastapi_utils.tasks import repeat_every
-
-from endpoints.stats import get_blockdag
-from server import sio, app
+from endpoints.dashboard import _get_block_dag_info
+from helper import notifications
+from helper.Event import throttled
+from server import sio
 
 BLOCKS_CACHE = []
 
+BLOCKDAG_EMIT_INTERVAL = 5
+
 
-@app.on_event("startup")
-@repeat_every(seconds=5)
+# pushed by virtual_daa_score_changed instead
+# @app.on_event("startup")
+# @repeat_every(seconds=5)
 async def periodical_blockdag():
     await emit_blockdag()
 
 
+@throttled(BLOCKDAG_EMIT_INTERVAL)
+async def on_virtual_daa_score_changed(daa_score):
+    await emit_blockdag()
+
+
+notifications.virtual_daa_score_changed += on_virtual_daa_score_changed
+
+
 async def emit_blockdag():
-    resp = await get_blockdag()
-    await sio.emit("blockdag", resp, room="blockdag")
+    # cached and dropped on new blocks, shared with the dashboard
+    resp = await _get_block_dag_info()
+    await sio.emit("blockdag", resp["getBlockDagInfoResponse"], room="blockdag")
@@ -1,6 +1,7 @@
 # encoding: utf-8
 
 
+from helper import notifications
 from server import kaspad_client, sio
 
 BLOCKS_CACHE = []
@@ -8,21 +9,22 @@ TASKS = []
 
 BLOCK_CACHE_SIZE = 5
 
-async def config():
-    async def on_new_block(e):
-        try:
-            block_info = e["blockAddedNotification"]["block"]
-        except KeyError:
-            return
 
-        global BLOCKS_CACHE
-        BLOCKS_CACHE.append(block_info)
-        if len(BLOCKS_CACHE) > BLOCK_CACHE_SIZE:
-            BLOCKS_CACHE.pop(0)
+async def on_new_block(block_info):
+    global BLOCKS_CACHE
+    BLOCKS_CACHE.append(block_info)
+    if len(BLOCKS_CACHE) > BLOCK_CACHE_SIZE:
+        BLOCKS_CACHE.pop(0)
+
+    await sio.emit("new-block", block_info, room="blocks")
+
 
-        await sio.emit("new-block", block_info, room="blocks")
+notifications.block_added += on_new_block
 
-    await kaspad_client.notify("notifyBlockAddedRequest", None, on_new_block)
+
+async def config():
+    # the one kaspad subscription of this process, see helper.notifications
+    await kaspad_client.subscribe(notifications.SUBSCRIPTIONS, notifications.publish)
 
 
 @sio.on("last-blocks")
@@ -5,6 +5,7 @@ from fastapi_utils.tasks import repeat_every
 from endpoints.stats import (
     get_virtual_selected_parent_blue_score,
 )
+from helper import notifications
 from server import sio, app
 
 BLOCKS_CACHE = []
@@ -19,3 +20,10 @@ async def periodical_blue_score():
 async def emit_bluescore():
     resp = await get_virtual_selected_parent_blue_score()
     await sio.emit("bluescore", resp, room="bluescore")
+
+
+async def on_virtual_blue_score_changed(blue_score):
+    await sio.emit("bluescore", {"blueScore": blue_score}, room="bluescore")
+
+
+notifications.virtual_blue_score_changed += on_virtual_blue_score_changed
@@ -0,0 +1,84 @@
+# encoding: utf-8
+import asyncio
+
+import grpc
+
+from kaspad import messages_pb2_grpc
+from kaspad.KaspadStream import KaspadStream
+from kaspad.KaspadThread import create_channel
+from kaspad.messages_pb2 import KaspadMessage
+
+BALANCES = {"kaspa:a": 1, "kaspa:b": 2}
+
+
+class FakeKaspad(messages_pb2_grpc.RPCServicer):
+    """
+    Answers one message after another like kaspad. Like golang kaspad, it does
+    not echo request ids unless echo_ids is set, and answers a balance request for
+    an unknown address with a getUtxosByAddressesResponse error.
+    """
+
+    def __init__(self, echo_ids=False):
+        self.echo_ids = echo_ids
+
+    async def MessageStream(self, request_iterator, context):
+        async for msg in request_iterator:
+            resp = KaspadMessage(id=msg.id if self.echo_ids else 0)
+            address = msg.getBalanceByAddressRequest.address
+
+            if address in BALANCES:
+                resp.getBalanceByAddressResponse.balance = BALANCES[address]
+            else:
+                resp.getUtxosByAddressesResponse.error.message = "invalid address"
+
+            yield resp
+
+
+async def with_stream(echo_ids, test):
+    server = grpc.aio.server()
+    messages_pb2_grpc.add_RPCServicer_to_server(FakeKaspad(echo_ids), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+
+    stream = KaspadStream(create_channel("127.0.0.1", port))
+
+    try:
+        await test(stream)
+    finally:
+        await stream.close()
+        await server.stop(0)
+
+
+async def balances(stream, addresses):
+    return await asyncio.gather(
+        *(
+            stream.request(
+                "getBalanceByAddressRequest", {"address": address}, timeout=2
+            )
+            for address in addresses
+        )
+    )
+
+
+def check_mismatched_response_type(echo_ids):
+    async def test(stream):
+        bad, a = await balances(stream, ["bad", "kaspa:a"])
+
+        assert bad.WhichOneof("payload") == "getUtxosByAddressesResponse"
+        assert bad.getUtxosByAddressesResponse.error.message == "invalid address"
+        assert a.getBalanceByAddressResponse.balance == 1
+
+        # the stream is still in step
+        b, a = await balances(stream, ["kaspa:b", "kaspa:a"])
+        assert b.getBalanceByAddressResponse.balance == 2
+        assert a.getBalanceByAddressResponse.balance == 1
+
+    asyncio.run(with_stream(echo_ids, test))
+
+
+def test_mismatched_response_type_without_ids():
+    check_mismatched_response_type(echo_ids=False)
+
+
+def test_mismatched_response_type_with_ids():
+    check_mismatched_response_type(echo_ids=True)